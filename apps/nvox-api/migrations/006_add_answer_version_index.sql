@@ -0,0 +1,7 @@
+-- Migration 006: Add unique index supporting answer version lookups
+-- Description: save_answer derives the next version from MAX(version) per
+--              (user_id, question_id); this index makes that an index-only
+--              scan and guarantees version numbers never collide.
+
+CREATE UNIQUE INDEX IF NOT EXISTS uk_answers_user_question_version
+    ON user_answers(user_id, question_id, version);
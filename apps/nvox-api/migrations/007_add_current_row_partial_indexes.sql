@@ -0,0 +1,31 @@
+-- Migration 007: Partial indexes for the is_current / is_active hot paths
+-- Description: the hot reads all filter on is_current = TRUE (current
+--              answers, current path entry) or is_active = TRUE (session
+--              auth checks). Partial indexes keep only the live rows, so
+--              these lookups become narrow index scans instead of heap
+--              filters over every historical version.
+
+-- get_current_answers filters by (user_id, stage_id, visit_number) on
+-- current rows only.
+CREATE INDEX IF NOT EXISTS idx_answers_current_stage
+    ON user_answers(user_id, stage_id, visit_number) WHERE is_current = TRUE;
+
+-- is_session_active / revoke_session look sessions up by token_jti and only
+-- care about active ones.
+CREATE INDEX IF NOT EXISTS idx_sessions_token_active
+    ON sessions(token_jti) WHERE is_active = TRUE;
+
+-- get_user_active_sessions / revoke_all_user_sessions scan by user over
+-- active sessions.
+CREATE INDEX IF NOT EXISTS idx_sessions_user_active
+    ON sessions(user_id) WHERE is_active = TRUE;
+
+-- get_stage_visit_count is a COUNT over (user_id, stage_id); this makes it
+-- an index-only scan.
+CREATE INDEX IF NOT EXISTS idx_journey_path_user_stage
+    ON user_journey_path(user_id, stage_id);
+
+-- Refresh planner statistics so the new indexes get picked immediately.
+ANALYZE user_answers;
+ANALYZE sessions;
+ANALYZE user_journey_path;
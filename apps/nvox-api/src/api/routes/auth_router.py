@@ -5,7 +5,7 @@ from repositories.session_repository import SessionRepository
 from repositories.journey_repository import JourneyRepository
 from dependencies.repositories import get_user_repository, get_session_repository, get_journey_repository
 from dependencies.auth import get_current_user
-from utils.hashing import hash_email, hash_password, verify_password
+from utils.hashing import hash_email, hash_password_async, verify_password_async
 from utils.jwt import create_access_token, get_jti_from_token, ACCESS_TOKEN_EXPIRE_MINUTES
 from journey.config_loader import get_journey_config
 from uuid import uuid4
@@ -28,7 +28,9 @@ async def signup(
             detail="User with this email already exists"
         )
 
-    password_hash = hash_password(request.password)
+    # Offloaded to the thread pool: the bcrypt KDF would otherwise block
+    # the event loop for the duration of the hash.
+    password_hash = await hash_password_async(request.password)
     user_id = uuid4()
     journey_started_at = datetime.utcnow()
 
@@ -66,7 +68,7 @@ async def login(
 
     dummy_hash = "$2b$12$dummy.hash.to.prevent.timing.attack.00000000000000000000000000000000000000000000"
     password_hash = user.password_hash if user else dummy_hash
-    is_valid = verify_password(request.password, password_hash)
+    is_valid = await verify_password_async(request.password, password_hash)
 
     if not is_valid or user is None:
         raise HTTPException(
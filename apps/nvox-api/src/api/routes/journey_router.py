@@ -16,6 +16,7 @@ from dependencies.auth import get_current_user
 from api.models.auth import TokenData
 from journey.routing_engine import get_routing_engine, RoutingEngine
 from utils.hashing import hash_email
+import asyncio
 import json
 
 
@@ -27,14 +28,16 @@ async def get_current_journey(
     current_user: TokenData = Depends(get_current_user),
     journey_repository: JourneyRepository = Depends(get_journey_repository),
 ) -> JourneyStateResponse:
-    journey_state = await journey_repository.get_user_journey_state(current_user.user_id)
+    snapshot = await journey_repository.get_journey_snapshot(current_user.user_id)
 
-    if not journey_state:
+    if not snapshot:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Journey state not found. Please contact support."
         )
 
+    journey_state = snapshot.state
+
     engine = get_routing_engine()
     stage_info = engine.get_stage_info(journey_state.current_stage_id)
 
@@ -44,11 +47,13 @@ async def get_current_journey(
             detail=f"Invalid stage: {journey_state.current_stage_id}"
         )
 
-    previous_answers = await journey_repository.get_current_answers(
-        current_user.user_id,
-        journey_state.current_stage_id,
-        journey_state.visit_number
-    )
+    # The snapshot carries every current answer; keep only the current
+    # stage/visit ones, which is what the separate query used to fetch.
+    previous_answers = [
+        answer for answer in snapshot.current_answers
+        if answer.stage_id == journey_state.current_stage_id
+        and answer.visit_number == journey_state.visit_number
+    ]
 
     answers_map = {
         answer.question_id: answer.answer_value
@@ -146,10 +151,15 @@ async def continue_journey(
 
     engine = RoutingEngine(graph_repository=graph_repository)
 
-    answers = await journey_repository.get_current_answers(
-        current_user.user_id,
-        current_stage_id,
-        current_visit_number
+    # Independent reads on distinct tables: run them concurrently, each on
+    # its own pool connection, instead of serially.
+    answers, visit_history = await asyncio.gather(
+        journey_repository.get_current_answers(
+            current_user.user_id,
+            current_stage_id,
+            current_visit_number
+        ),
+        journey_repository.get_visit_history(current_user.user_id)
     )
 
     answers_dict = {
@@ -157,8 +167,6 @@ async def continue_journey(
         for answer in answers
     }
 
-    visit_history = await journey_repository.get_visit_history(current_user.user_id)
-
     transition_decision = await engine.evaluate_transition_with_graph(
         current_stage_id,
         answers_dict,
@@ -239,7 +247,10 @@ async def get_journey_history(
     current_user: TokenData = Depends(get_current_user),
     journey_repository: JourneyRepository = Depends(get_journey_repository),
 ) -> JourneyHistoryResponse:
-    journey_state = await journey_repository.get_user_journey_state(current_user.user_id)
+    journey_state, path_history = await asyncio.gather(
+        journey_repository.get_user_journey_state(current_user.user_id),
+        journey_repository.get_path_history(current_user.user_id)
+    )
 
     if not journey_state:
         raise HTTPException(
@@ -247,8 +258,6 @@ async def get_journey_history(
             detail="Journey state not found"
         )
 
-    path_history = await journey_repository.get_path_history(current_user.user_id)
-
     engine = get_routing_engine()
 
     stages = []
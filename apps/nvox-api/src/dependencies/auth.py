@@ -1,4 +1,4 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from uuid import UUID
 from typing import Optional
@@ -10,7 +10,21 @@ from dependencies.repositories import get_session_repository
 security = HTTPBearer(auto_error=False)
 
 
+def get_jwt_payload(request: Request, token: str) -> Optional[dict]:
+    """Decode the token once per request, memoizing on request.state.
+
+    Anything else in the request cycle that needs the claims can read the
+    cached payload instead of re-verifying the HMAC.
+    """
+    payload = getattr(request.state, "jwt_payload", None)
+    if payload is None:
+        payload = decode_access_token(token)
+        request.state.jwt_payload = payload
+    return payload
+
+
 async def get_current_user(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     session_repository: SessionRepository = Depends(get_session_repository)
 ) -> TokenData:
@@ -23,7 +37,7 @@ async def get_current_user(
 
     token = credentials.credentials
 
-    payload = decode_access_token(token)
+    payload = get_jwt_payload(request, token)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
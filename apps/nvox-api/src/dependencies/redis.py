@@ -1,5 +1,15 @@
+from typing import Optional
+
 from nvox_common.db.redis_client import RedisClient
 
 
 async def get_redis_client() -> RedisClient:
     raise NotImplementedError("Should be set as an override in application lifespan")
+
+
+async def get_optional_redis_client() -> Optional[RedisClient]:
+    # Overridden in the application lifespan alongside get_redis_client.
+    # Defaults to None so consumers that merely use Redis as a cache (e.g.
+    # SessionRepository) degrade to Postgres-only when Redis is absent,
+    # such as in the test suite.
+    return None
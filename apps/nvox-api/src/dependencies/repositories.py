@@ -1,22 +1,27 @@
+from typing import Optional
 from fastapi import Depends
 from nvox_common.db.nvox_db_client import NvoxDBClient
+from nvox_common.db.redis_client import RedisClient
 from repositories.user_repository import UserRepository
 from repositories.session_repository import SessionRepository
 from repositories.journey_repository import JourneyRepository
 from repositories.graph_repository import GraphRepository
 from dependencies.db import get_db_client
+from dependencies.redis import get_optional_redis_client
 
 
 def get_user_repository(
-    db_client: NvoxDBClient = Depends(get_db_client)
+    db_client: NvoxDBClient = Depends(get_db_client),
+    redis_client: Optional[RedisClient] = Depends(get_optional_redis_client)
 ) -> UserRepository:
-    return UserRepository(db_client)
+    return UserRepository(db_client, redis_client)
 
 
 def get_session_repository(
-    db_client: NvoxDBClient = Depends(get_db_client)
+    db_client: NvoxDBClient = Depends(get_db_client),
+    redis_client: Optional[RedisClient] = Depends(get_optional_redis_client)
 ) -> SessionRepository:
-    return SessionRepository(db_client)
+    return SessionRepository(db_client, redis_client)
 
 
 def get_journey_repository(
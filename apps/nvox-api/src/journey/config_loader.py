@@ -1,4 +1,4 @@
-import json
+import orjson
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -112,13 +112,14 @@ class JourneyConfig:
 
     @classmethod
     def from_file(cls, file_path: Path) -> "JourneyConfig":
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        # orjson parses bytes directly, so read the file in binary mode.
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
         return cls(data)
 
     @classmethod
     def from_json_string(cls, json_string: str) -> "JourneyConfig":
-        data = json.loads(json_string)
+        data = orjson.loads(json_string)
         return cls(data)
 
 
@@ -130,18 +131,18 @@ async def load_journey_config(config_path: Path, redis_client=None) -> JourneyCo
     _journey_config = JourneyConfig.from_file(config_path)
 
     if redis_client:
-        import json
-
-        config_json = json.dumps({
+        config_json = orjson.dumps({
             "version": _journey_config.version,
             "domain": _journey_config.domain,
             "entry_stage": _journey_config.entry_stage,
             "stages": [s.to_dict() for s in _journey_config.stages]
-        })
+        }).decode()
         await redis_client.set("route:config", config_json)
 
         for stage in _journey_config.stages:
-            stage_questions_json = json.dumps([q.to_dict() for q in stage.questions])
+            stage_questions_json = orjson.dumps(
+                [q.to_dict() for q in stage.questions]
+            ).decode()
             await redis_client.set(f"route:stage:{stage.id}:questions", stage_questions_json)
 
     return _journey_config
@@ -1,5 +1,6 @@
+import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Any
 from pathlib import Path
@@ -21,7 +22,16 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> Any:
     db_client = PostgresClient()
-    conn = await db_client.connect()
+    redis_client = RedisClient()
+    # The two backends are independent, so their pool warmups (TCP
+    # handshakes plus asyncpg's min_size connection builds) overlap instead
+    # of running back to back.
+    conn, redis_conn = await asyncio.gather(
+        db_client.connect(), redis_client.connect()
+    )
+    _app.state.pg = db_client
+    _app.state.redis = redis_client
+
     nvox_db_client = NvoxDBClient(conn)
     _app.dependency_overrides[db.get_db_client] = lambda: nvox_db_client
 
@@ -34,9 +44,8 @@ async def lifespan(_app: FastAPI) -> Any:
         logger.error("Application startup aborted due to schema mismatch")
         raise
 
-    redis_client = RedisClient()
-    redis_conn = await redis_client.connect()
     _app.dependency_overrides[redis_dep.get_redis_client] = lambda: redis_client
+    _app.dependency_overrides[redis_dep.get_optional_redis_client] = lambda: redis_client
 
     config_path = Path(__file__).parent / "config" / "journey_config.json"
 
@@ -45,8 +54,7 @@ async def lifespan(_app: FastAPI) -> Any:
     try:
         yield
     finally:
-        await db_client.disconnect()
-        await redis_client.disconnect()
+        await asyncio.gather(db_client.disconnect(), redis_client.disconnect())
 
 
 app = FastAPI(
@@ -73,5 +81,25 @@ async def alive() -> dict[str, bool]:
     return {"alive": True}
 
 
+@app.get("/ready")
+async def ready(response: Response) -> dict[str, bool]:
+    # Readiness probe: both backends are checked concurrently. Before the
+    # lifespan has run (or after a failed startup) the clients are absent
+    # and the probe reports not ready rather than erroring.
+    pg = getattr(app.state, "pg", None)
+    redis_client = getattr(app.state, "redis", None)
+
+    if pg is None or redis_client is None:
+        db_ok = redis_ok = False
+    else:
+        db_ok, redis_ok = await asyncio.gather(
+            pg.check_db_health(), redis_client.check_redis_health()
+        )
+
+    if not (db_ok and redis_ok):
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {"ready": db_ok and redis_ok, "database": db_ok, "redis": redis_ok}
+
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
@@ -84,15 +84,28 @@ class UserJourneyPathDB(BaseModel):
     is_current: bool
 
 
+class JourneySnapshotDB(BaseModel):
+    """Journey state plus its current path entry and current answers,
+    assembled from a single query instead of three."""
+
+    state: UserJourneyStateDB
+    current_path: Optional[UserJourneyPathDB] = None
+    current_answers: list[UserAnswerDB] = Field(default_factory=list)
+
+
 def record_to_model(record: Any, model_class: type[BaseModel]) -> BaseModel:
+    # Rows come straight from asyncpg with native Python types and a shape
+    # that validate_all_schemas checked at startup, so skip Pydantic
+    # validation with model_construct. asyncpg Records unpack as mappings,
+    # avoiding the intermediate dict() copy too.
     if record is None:
         raise ValueError("Cannot convert None record to model")
 
-    return model_class(**dict(record))
+    return model_class.model_construct(**record)
 
 
 def records_to_models(records: list[Any], model_class: type[BaseModel]) -> list[BaseModel]:
-    return [record_to_model(record, model_class) for record in records]
+    return [model_class.model_construct(**record) for record in records]
 
 
 def optional_record_to_model(
@@ -1,15 +1,16 @@
-from typing import Optional, Any, List, Dict
+from typing import AsyncIterator, Optional, Any, List, Dict
 from uuid import UUID
 from datetime import datetime
 from nvox_common.db.nvox_db_client import NvoxDBClient
 import asyncpg
-import json
+import orjson
 
 from .db_models import (
     UserJourneyStateDB,
     UserAnswerDB,
     StageTransitionDB,
     UserJourneyPathDB,
+    JourneySnapshotDB,
     optional_record_to_model,
     records_to_models
 )
@@ -22,12 +23,70 @@ class JourneyRepository:
     async def get_user_journey_state(self, user_id: UUID) -> Optional[UserJourneyStateDB]:
         row = await self.db_client.fetchRow(
             """
-            SELECT * FROM user_journey_state WHERE user_id = $1
+            SELECT id, user_id, current_stage_id, visit_number, journey_started_at, last_updated_at, created_at
+            FROM user_journey_state WHERE user_id = $1
             """,
             user_id
         )
         return optional_record_to_model(row, UserJourneyStateDB)
 
+    async def get_journey_snapshot(self, user_id: UUID) -> Optional[JourneySnapshotDB]:
+        """Fetch journey state, current path entry and all current answers in
+        one query instead of three sequential round-trips.
+
+        The path row and the answers are folded into JSON columns server-side
+        and parsed back into their DB models here. answer_value is cast to
+        text before aggregation so it stays the raw JSON text, exactly as
+        asyncpg returns jsonb columns on the row-per-answer path.
+        """
+        row = await self.db_client.fetchRow(
+            """
+            SELECT s.id, s.user_id, s.current_stage_id, s.visit_number,
+                   s.journey_started_at, s.last_updated_at, s.created_at,
+                   row_to_json(p.*) AS current_path,
+                   COALESCE(
+                       json_agg(
+                           json_build_object(
+                               'id', a.id,
+                               'user_id', a.user_id,
+                               'stage_id', a.stage_id,
+                               'question_id', a.question_id,
+                               'answer_value', a.answer_value::text,
+                               'visit_number', a.visit_number,
+                               'answered_at', a.answered_at,
+                               'version', a.version,
+                               'is_current', a.is_current
+                           )
+                       ) FILTER (WHERE a.id IS NOT NULL),
+                       '[]'
+                   ) AS current_answers
+            FROM user_journey_state s
+            LEFT JOIN user_journey_path p
+                ON p.user_id = s.user_id AND p.is_current = TRUE
+            LEFT JOIN user_answers a
+                ON a.user_id = s.user_id AND a.is_current = TRUE
+            WHERE s.user_id = $1
+            GROUP BY s.id, p.id
+            """,
+            user_id
+        )
+        if row is None:
+            return None
+
+        data = dict(row)
+        path_json = data.pop("current_path")
+        answers_json = data.pop("current_answers")
+
+        return JourneySnapshotDB(
+            state=UserJourneyStateDB(**data),
+            current_path=(
+                UserJourneyPathDB(**orjson.loads(path_json)) if path_json else None
+            ),
+            current_answers=[
+                UserAnswerDB(**answer) for answer in orjson.loads(answers_json)
+            ]
+        )
+
     async def create_journey_state(
         self,
         user_id: UUID,
@@ -71,42 +130,79 @@ class JourneyRepository:
         answer_value: Any,
         visit_number: int
     ) -> None:
-
+        # Single round-trip: demote previous versions and insert the new one
+        # in one statement. The UPDATE's RETURNING feeds the version bump, so
+        # no separate SELECT MAX(version) query is needed.
         await self.db_client.execute(
             """
-            UPDATE user_answers
-            SET is_current = FALSE
-            WHERE user_id = $1 AND question_id = $2
+            WITH previous AS (
+                UPDATE user_answers
+                SET is_current = FALSE
+                WHERE user_id = $1 AND question_id = $3
+                RETURNING version
+            )
+            INSERT INTO user_answers (
+                user_id, stage_id, question_id, answer_value,
+                visit_number, version, is_current
+            )
+            SELECT $1, $2, $3, $4, $5, COALESCE(MAX(version), 0) + 1, TRUE
+            FROM previous
             """,
             user_id,
-            question_id
+            stage_id,
+            question_id,
+            orjson.dumps(answer_value).decode(),
+            visit_number
         )
 
-        version_result = await self.db_client.fetchRow(
-            """
-            SELECT COALESCE(MAX(version), 0) + 1 as next_version
-            FROM user_answers
-            WHERE user_id = $1 AND question_id = $2
-            """,
-            user_id,
-            question_id
-        )
-        next_version = dict(version_result)["next_version"] if version_result else 1
+    async def save_answers_bulk(
+        self,
+        user_id: UUID,
+        answers: List[tuple[str, str, Any, int]]
+    ) -> None:
+        """Save many (stage_id, question_id, answer_value, visit_number)
+        answers in one statement instead of N save_answer round-trips.
+
+        Same versioning semantics as save_answer: prior versions are demoted
+        and each new row gets MAX(version) + 1 for its question.
+        """
+        if not answers:
+            return
+
+        stage_ids = [stage_id for stage_id, _, _, _ in answers]
+        question_ids = [question_id for _, question_id, _, _ in answers]
+        answer_values = [orjson.dumps(value).decode() for _, _, value, _ in answers]
+        visit_numbers = [visit_number for _, _, _, visit_number in answers]
 
         await self.db_client.execute(
             """
+            WITH input AS (
+                SELECT * FROM UNNEST($2::text[], $3::text[], $4::jsonb[], $5::int[])
+                    AS t(stage_id, question_id, answer_value, visit_number)
+            ), previous AS (
+                UPDATE user_answers a
+                SET is_current = FALSE
+                FROM input i
+                WHERE a.user_id = $1 AND a.question_id = i.question_id
+                RETURNING a.question_id, a.version
+            )
             INSERT INTO user_answers (
                 user_id, stage_id, question_id, answer_value,
                 visit_number, version, is_current
             )
-            VALUES ($1, $2, $3, $4, $5, $6, TRUE)
+            SELECT $1, i.stage_id, i.question_id, i.answer_value, i.visit_number,
+                   COALESCE(
+                       (SELECT MAX(p.version) FROM previous p WHERE p.question_id = i.question_id),
+                       0
+                   ) + 1,
+                   TRUE
+            FROM input i
             """,
             user_id,
-            stage_id,
-            question_id,
-            json.dumps(answer_value),
-            visit_number,
-            next_version
+            stage_ids,
+            question_ids,
+            answer_values,
+            visit_numbers
         )
 
     async def get_current_answers(
@@ -118,7 +214,8 @@ class JourneyRepository:
         if stage_id and visit_number is not None:
             rows = await self.db_client.fetch(
                 """
-                SELECT * FROM user_answers
+                SELECT id, user_id, stage_id, question_id, answer_value, visit_number, answered_at, version, is_current
+                FROM user_answers
                 WHERE user_id = $1 AND stage_id = $2 AND visit_number = $3 AND is_current = TRUE
                 ORDER BY answered_at DESC
                 """,
@@ -129,7 +226,8 @@ class JourneyRepository:
         elif stage_id:
             rows = await self.db_client.fetch(
                 """
-                SELECT * FROM user_answers
+                SELECT id, user_id, stage_id, question_id, answer_value, visit_number, answered_at, version, is_current
+                FROM user_answers
                 WHERE user_id = $1 AND stage_id = $2 AND is_current = TRUE
                 ORDER BY answered_at DESC
                 """,
@@ -139,7 +237,8 @@ class JourneyRepository:
         else:
             rows = await self.db_client.fetch(
                 """
-                SELECT * FROM user_answers
+                SELECT id, user_id, stage_id, question_id, answer_value, visit_number, answered_at, version, is_current
+                FROM user_answers
                 WHERE user_id = $1 AND is_current = TRUE
                 ORDER BY answered_at DESC
                 """,
@@ -154,7 +253,8 @@ class JourneyRepository:
     ) -> Optional[UserAnswerDB]:
         row = await self.db_client.fetchRow(
             """
-            SELECT * FROM user_answers
+            SELECT id, user_id, stage_id, question_id, answer_value, visit_number, answered_at, version, is_current
+                FROM user_answers
             WHERE user_id = $1 AND question_id = $2 AND is_current = TRUE
             """,
             user_id,
@@ -162,21 +262,32 @@ class JourneyRepository:
         )
         return optional_record_to_model(row, UserAnswerDB)
 
-    async def get_answer_history(
+    async def iter_answer_history(
         self,
         user_id: UUID,
         question_id: str
-    ) -> List[UserAnswerDB]:
-        rows = await self.db_client.fetch(
+    ) -> AsyncIterator[UserAnswerDB]:
+        """Stream the full version history of an answer one row at a time via
+        a server-side cursor, so long histories never materialize in memory.
+        """
+        async for row in self.db_client.iterate(
             """
-            SELECT * FROM user_answers
+            SELECT id, user_id, stage_id, question_id, answer_value, visit_number, answered_at, version, is_current
+                FROM user_answers
             WHERE user_id = $1 AND question_id = $2
             ORDER BY version DESC
             """,
             user_id,
             question_id
-        )
-        return records_to_models(rows, UserAnswerDB)
+        ):
+            yield UserAnswerDB.model_construct(**row)
+
+    async def get_answer_history(
+        self,
+        user_id: UUID,
+        question_id: str
+    ) -> List[UserAnswerDB]:
+        return [answer async for answer in self.iter_answer_history(user_id, question_id)]
 
     async def record_transition(
         self,
@@ -207,22 +318,31 @@ class JourneyRepository:
             transition_reason,
             matched_rule_id,
             matched_question_id,
-            json.dumps(matched_answer_value) if matched_answer_value is not None else None
+            orjson.dumps(matched_answer_value).decode() if matched_answer_value is not None else None
         )
 
-    async def get_transition_history(
+    async def iter_transition_history(
         self,
         user_id: UUID
-    ) -> List[StageTransitionDB]:
-        rows = await self.db_client.fetch(
+    ) -> AsyncIterator[StageTransitionDB]:
+        async for row in self.db_client.iterate(
             """
-            SELECT * FROM stage_transitions
+            SELECT id, user_id, from_stage_id, to_stage_id, from_visit_number, to_visit_number,
+                   transition_reason, matched_rule_id, matched_question_id,
+                   matched_answer_value, transitioned_at
+            FROM stage_transitions
             WHERE user_id = $1
             ORDER BY transitioned_at ASC
             """,
             user_id
-        )
-        return records_to_models(rows, StageTransitionDB)
+        ):
+            yield StageTransitionDB.model_construct(**row)
+
+    async def get_transition_history(
+        self,
+        user_id: UUID
+    ) -> List[StageTransitionDB]:
+        return [transition async for transition in self.iter_transition_history(user_id)]
 
     async def enter_stage(
         self,
@@ -230,20 +350,21 @@ class JourneyRepository:
         stage_id: str,
         visit_number: int
     ) -> None:
-
-        await self.db_client.execute(
-            """
-            UPDATE user_journey_path
-            SET exited_at = NOW(), is_current = FALSE
-            WHERE user_id = $1 AND is_current = TRUE
-            """,
-            user_id
-        )
-
+        # Close the previous entry and open the new one in a single
+        # round-trip. The INSERT selects from the CTE's result so the close
+        # completes first, keeping the partial unique index on (user_id)
+        # WHERE is_current satisfied.
         await self.db_client.execute(
             """
+            WITH closed AS (
+                UPDATE user_journey_path
+                SET exited_at = NOW(), is_current = FALSE
+                WHERE user_id = $1 AND is_current = TRUE
+                RETURNING 1
+            )
             INSERT INTO user_journey_path (user_id, stage_id, visit_number, is_current)
-            VALUES ($1, $2, $3, TRUE)
+            SELECT $1, $2, $3, TRUE
+            FROM (SELECT COUNT(*) FROM closed) AS done
             """,
             user_id,
             stage_id,
@@ -256,42 +377,50 @@ class JourneyRepository:
     ) -> Optional[UserJourneyPathDB]:
         row = await self.db_client.fetchRow(
             """
-            SELECT * FROM user_journey_path
+            SELECT id, user_id, stage_id, visit_number, entered_at, exited_at, is_current
+            FROM user_journey_path
             WHERE user_id = $1 AND is_current = TRUE
             """,
             user_id
         )
         return optional_record_to_model(row, UserJourneyPathDB)
 
-    async def get_path_history(
+    async def iter_path_history(
         self,
         user_id: UUID
-    ) -> List[UserJourneyPathDB]:
-        rows = await self.db_client.fetch(
+    ) -> AsyncIterator[UserJourneyPathDB]:
+        async for row in self.db_client.iterate(
             """
-            SELECT * FROM user_journey_path
+            SELECT id, user_id, stage_id, visit_number, entered_at, exited_at, is_current
+            FROM user_journey_path
             WHERE user_id = $1
             ORDER BY entered_at ASC
             """,
             user_id
-        )
-        return records_to_models(rows, UserJourneyPathDB)
+        ):
+            yield UserJourneyPathDB.model_construct(**row)
+
+    async def get_path_history(
+        self,
+        user_id: UUID
+    ) -> List[UserJourneyPathDB]:
+        return [entry async for entry in self.iter_path_history(user_id)]
 
     async def get_stage_visit_count(
         self,
         user_id: UUID,
         stage_id: str
     ) -> int:
-        result = await self.db_client.fetchRow(
+        count = await self.db_client.fetchVal(
             """
-            SELECT COUNT(*) as visit_count
+            SELECT COUNT(*)
             FROM user_journey_path
             WHERE user_id = $1 AND stage_id = $2
             """,
             user_id,
             stage_id
         )
-        return dict(result)["visit_count"] if result else 0
+        return count or 0
 
     async def anonymize_user_data(self, user_id: UUID, anonymized_email_hash: str) -> None:
 
@@ -307,18 +436,42 @@ class JourneyRepository:
             user_id
         )
 
+    async def anonymize_users_bulk(self, items: List[tuple[UUID, str]]) -> None:
+        """Anonymize many users in one statement instead of one UPDATE per user."""
+        if not items:
+            return
+
+        user_ids = [user_id for user_id, _ in items]
+        email_hashes = [email_hash for _, email_hash in items]
+
+        await self.db_client.execute(
+            """
+            UPDATE users
+            SET email_hash = x.anonymized_hash,
+                password_hash = 'ANONYMIZED',
+                updated_at = NOW()
+            FROM UNNEST($1::uuid[], $2::text[]) AS x(user_id, anonymized_hash)
+            WHERE users.id = x.user_id
+            """,
+            user_ids,
+            email_hashes
+        )
+
     async def get_visit_history(self, user_id: UUID) -> List[str]:
-        rows = await self.db_client.fetch(
+        # Aggregate server-side: one row with a text[] that asyncpg decodes
+        # straight to list[str], instead of one Record per visited stage.
+        stage_ids = await self.db_client.fetchVal(
             """
-            SELECT stage_id
-            FROM user_journey_path
-            WHERE user_id = $1
-            GROUP BY stage_id
-            ORDER BY MIN(entered_at) ASC
+            SELECT ARRAY_AGG(stage_id ORDER BY first_entered) FROM (
+                SELECT stage_id, MIN(entered_at) AS first_entered
+                FROM user_journey_path
+                WHERE user_id = $1
+                GROUP BY stage_id
+            ) AS visits
             """,
             user_id
         )
-        return [row["stage_id"] for row in rows]
+        return stage_ids or []
 
     async def perform_stage_transition(
         self,
@@ -332,56 +485,45 @@ class JourneyRepository:
         matched_question_id: Optional[str] = None,
         matched_answer_value: Optional[Any] = None
     ) -> None:
-        async with self.db_client.transaction() as tx:
-            # Record the transition
-            await tx.execute(
-                """
+        # One atomic statement instead of a 4-statement transaction: each
+        # sub-operation is a data-modifying CTE, so the transition costs a
+        # single round-trip. The final INSERT selects FROM the path UPDATE's
+        # result to force it to complete first, keeping the partial unique
+        # index on (user_id) WHERE is_current happy.
+        await self.db_client.execute(
+            """
+            WITH transition AS (
                 INSERT INTO stage_transitions (
                     user_id, from_stage_id, to_stage_id, from_visit_number,
                     to_visit_number, transition_reason, matched_rule_id,
                     matched_question_id, matched_answer_value
                 )
                 VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                """,
-                user_id,
-                from_stage_id,
-                to_stage_id,
-                from_visit_number,
-                to_visit_number,
-                transition_reason,
-                matched_rule_id,
-                matched_question_id,
-                json.dumps(matched_answer_value) if matched_answer_value is not None else None
-            )
-
-            await tx.execute(
-                """
+                RETURNING 1
+            ), state AS (
                 UPDATE user_journey_state
-                SET current_stage_id = $1,
-                    visit_number = $2,
+                SET current_stage_id = $3,
+                    visit_number = $5,
                     last_updated_at = NOW()
-                WHERE user_id = $3
-                """,
-                to_stage_id,
-                to_visit_number,
-                user_id
-            )
-
-            await tx.execute(
-                """
+                WHERE user_id = $1
+                RETURNING 1
+            ), closed_path AS (
                 UPDATE user_journey_path
                 SET exited_at = NOW(), is_current = FALSE
                 WHERE user_id = $1 AND is_current = TRUE
-                """,
-                user_id
-            )
-
-            await tx.execute(
-                """
-                INSERT INTO user_journey_path (user_id, stage_id, visit_number, is_current)
-                VALUES ($1, $2, $3, TRUE)
-                """,
-                user_id,
-                to_stage_id,
-                to_visit_number
+                RETURNING 1
             )
+            INSERT INTO user_journey_path (user_id, stage_id, visit_number, is_current)
+            SELECT $1, $3, $5, TRUE
+            FROM (SELECT COUNT(*) FROM transition, state, closed_path) AS done
+            """,
+            user_id,
+            from_stage_id,
+            to_stage_id,
+            from_visit_number,
+            to_visit_number,
+            transition_reason,
+            matched_rule_id,
+            matched_question_id,
+            orjson.dumps(matched_answer_value).decode() if matched_answer_value is not None else None
+        )
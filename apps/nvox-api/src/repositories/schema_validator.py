@@ -1,4 +1,5 @@
 from typing import Type
+import asyncio
 import logging
 
 from pydantic import BaseModel, ValidationError
@@ -66,13 +67,27 @@ async def validate_all_schemas(db_client: NvoxDBClient) -> None:
         ("user_journey_path", UserJourneyPathDB),
     ]
 
+    # Each validation is an independent single-row read on its own pool
+    # connection, so run them all concurrently instead of paying one
+    # round-trip after another at startup.
+    results = await asyncio.gather(
+        *(
+            validate_table_schema(db_client, table_name, model_class)
+            for table_name, model_class in tables_to_validate
+        ),
+        return_exceptions=True
+    )
+
+    # Only genuine schema mismatches are aggregated into the summary;
+    # anything else (connection refused, auth failure, driver bugs) keeps
+    # its real type and traceback instead of masquerading as a validation
+    # failure.
     validation_errors = []
-
-    for table_name, model_class in tables_to_validate:
-        try:
-            await validate_table_schema(db_client, table_name, model_class)
-        except SchemaValidationError as e:
-            validation_errors.append(str(e))
+    for result in results:
+        if isinstance(result, SchemaValidationError):
+            validation_errors.append(str(result))
+        elif isinstance(result, BaseException):
+            raise result
 
     if validation_errors:
         error_summary = "\n".join(validation_errors)
@@ -2,13 +2,36 @@ from typing import Optional
 from uuid import UUID
 from datetime import datetime
 from nvox_common.db.nvox_db_client import NvoxDBClient
+from nvox_common.db.redis_client import RedisClient
 
 from .db_models import SessionDB, records_to_models
 
+# Negative results are cached briefly so a revoked/unknown jti being retried
+# doesn't hammer Postgres, while a later login with the same jti (impossible
+# in practice, jtis are uuid4) would still be picked up quickly.
+SESSION_NEGATIVE_CACHE_TTL_SECONDS = 60
+
+# Positive entries get the same short cap rather than the full token
+# lifetime: a reader that checked Postgres just before a revoke can write
+# its stale "1" just after, and a revoke can only tombstone what it can
+# see — the cap bounds how long any such stale entry can survive.
+SESSION_POSITIVE_CACHE_TTL_SECONDS = 60
+
 
 class SessionRepository:
-    def __init__(self, db_client: NvoxDBClient):
+    def __init__(self, db_client: NvoxDBClient, redis_client: Optional[RedisClient] = None):
         self.db_client = db_client
+        self.redis_client = redis_client
+
+    @property
+    def _redis(self):
+        if self.redis_client is None:
+            return None
+        return self.redis_client.client
+
+    @staticmethod
+    def _cache_key(token_jti: str) -> str:
+        return f"sess:{token_jti}"
 
     async def create_session(
         self,
@@ -27,6 +50,15 @@ class SessionRepository:
             expires_at
         )
 
+        redis = self._redis
+        if redis is not None:
+            ttl = int((expires_at - datetime.utcnow()).total_seconds())
+            if ttl > 0:
+                await redis.set(
+                    self._cache_key(token_jti), "1",
+                    ex=min(ttl, SESSION_POSITIVE_CACHE_TTL_SECONDS)
+                )
+
     async def revoke_session(self, token_jti: str) -> bool:
         result = await self.db_client.execute(
             """
@@ -37,32 +69,59 @@ class SessionRepository:
             token_jti
         )
 
+        # Tombstone rather than delete: a delete leaves the key free for a
+        # racing reader to repopulate with a pre-revoke "1", whereas the
+        # "0" wins over anything written from stale state.
+        redis = self._redis
+        if redis is not None:
+            await redis.set(
+                self._cache_key(token_jti), "0",
+                ex=SESSION_NEGATIVE_CACHE_TTL_SECONDS
+            )
+
         rows_updated = int(result.split()[-1]) if result else 0
         return rows_updated > 0
 
     async def is_session_active(self, token_jti: str) -> bool:
-        session = await self.db_client.fetchRow(
+        redis = self._redis
+        if redis is not None:
+            cached = await redis.get(self._cache_key(token_jti))
+            if cached is not None:
+                return cached == "1"
+
+        # Cache miss (or no Redis): one round-trip to Postgres. Fetch the
+        # expiry rather than a bare EXISTS so the positive cache entry never
+        # outlives the token, even when the token expires inside the cap.
+        expires_at = await self.db_client.fetchVal(
             """
-            SELECT is_active, expires_at
-            FROM sessions
-            WHERE token_jti = $1
+            SELECT expires_at FROM sessions
+            WHERE token_jti = $1 AND is_active = TRUE AND expires_at > NOW()
             """,
             token_jti
         )
-
-        if session is None:
-            return False
-
-        is_active = session["is_active"]
-        expires_at = session["expires_at"]
-        now = datetime.utcnow()
-
-        return is_active and expires_at > now
+        is_active = expires_at is not None
+
+        if redis is not None:
+            if is_active:
+                ttl = int((expires_at - datetime.utcnow()).total_seconds())
+                if ttl > 0:
+                    await redis.set(
+                        self._cache_key(token_jti), "1",
+                        ex=min(ttl, SESSION_POSITIVE_CACHE_TTL_SECONDS)
+                    )
+            else:
+                await redis.set(
+                    self._cache_key(token_jti), "0",
+                    ex=SESSION_NEGATIVE_CACHE_TTL_SECONDS
+                )
+
+        return is_active
 
     async def get_user_active_sessions(self, user_id: UUID) -> list[SessionDB]:
         rows = await self.db_client.fetch(
             """
-            SELECT * FROM sessions
+            SELECT id, user_id, token_jti, expires_at, created_at, revoked_at, is_active
+            FROM sessions
             WHERE user_id = $1 AND is_active = TRUE AND expires_at > NOW()
             ORDER BY created_at DESC
             """,
@@ -71,17 +130,29 @@ class SessionRepository:
         return records_to_models(rows, SessionDB)
 
     async def revoke_all_user_sessions(self, user_id: UUID) -> int:
-        result = await self.db_client.execute(
+        rows = await self.db_client.fetch(
             """
             UPDATE sessions
             SET is_active = FALSE, revoked_at = NOW()
             WHERE user_id = $1 AND is_active = TRUE
+            RETURNING token_jti
             """,
             user_id
         )
 
-        rows_updated = int(result.split()[-1]) if result else 0
-        return rows_updated
+        # Same tombstone reasoning as revoke_session; one pipelined
+        # round-trip covers all revoked jtis.
+        redis = self._redis
+        if redis is not None and rows:
+            async with redis.pipeline(transaction=False) as pipe:
+                for row in rows:
+                    pipe.set(
+                        self._cache_key(row["token_jti"]), "0",
+                        ex=SESSION_NEGATIVE_CACHE_TTL_SECONDS
+                    )
+                await pipe.execute()
+
+        return len(rows)
 
     async def cleanup_expired_sessions(self) -> int:
         result = await self.db_client.execute(
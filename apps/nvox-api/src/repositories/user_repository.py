@@ -2,27 +2,63 @@ from typing import Optional
 from uuid import UUID
 from datetime import datetime
 from nvox_common.db.nvox_db_client import NvoxDBClient
+from nvox_common.db.redis_client import RedisClient
 
 from .db_models import UserDB, optional_record_to_model
 
+# The signup existence check is a read-only boolean keyed by the email
+# hash, so both answers cache well. A short TTL bounds staleness for the
+# "0" case; user creation refreshes the key to "1" immediately, so the
+# duplicate-signup 409 stays accurate without waiting for expiry.
+USER_EXISTS_CACHE_TTL_SECONDS = 300
+
 
 class UserRepository:
-    def __init__(self, db_client: NvoxDBClient):
+    def __init__(self, db_client: NvoxDBClient, redis_client: Optional[RedisClient] = None):
         self.db_client = db_client
+        self.redis_client = redis_client
+
+    @property
+    def _redis(self):
+        if self.redis_client is None:
+            return None
+        return self.redis_client.client
+
+    @staticmethod
+    def _exists_key(email_hash: str) -> str:
+        return f"u:exists:{email_hash}"
 
     async def get_user_by_email_hash(self, email_hash: str) -> Optional[UserDB]:
         row = await self.db_client.fetchRow(
-            "SELECT * FROM users WHERE email_hash = $1",
+            """
+            SELECT id, email_hash, password_hash, journey_stage, journey_started_at, created_at, updated_at
+            FROM users WHERE email_hash = $1
+            """,
             email_hash
         )
         return optional_record_to_model(row, UserDB)
 
     async def user_exists_by_email_hash(self, email_hash: str) -> bool:
+        redis = self._redis
+        if redis is not None:
+            cached = await redis.get(self._exists_key(email_hash))
+            if cached is not None:
+                return cached == "1"
+
         result = await self.db_client.fetchRow(
             "SELECT id FROM users WHERE email_hash = $1",
             email_hash
         )
-        return result is not None
+        exists = result is not None
+
+        if redis is not None:
+            await redis.set(
+                self._exists_key(email_hash),
+                "1" if exists else "0",
+                ex=USER_EXISTS_CACHE_TTL_SECONDS
+            )
+
+        return exists
 
     async def create_user(
         self,
@@ -32,24 +68,51 @@ class UserRepository:
         journey_stage: str = "REFERRAL",
         journey_started_at: Optional[datetime] = None
     ) -> None:
+        # journey_started_at defaults to NOW() server-side; when the caller
+        # doesn't override it, omitting the column lets the server stamp the
+        # row instead of encoding a client-clock timestamp over the wire.
         if journey_started_at is None:
-            journey_started_at = datetime.utcnow()
+            await self.db_client.execute(
+                """
+                INSERT INTO users (id, email_hash, password_hash, journey_stage)
+                VALUES ($1, $2, $3, $4)
+                """,
+                user_id,
+                email_hash,
+                password_hash,
+                journey_stage
+            )
+        else:
+            await self.db_client.execute(
+                """
+                INSERT INTO users (id, email_hash, password_hash, journey_stage, journey_started_at)
+                VALUES ($1, $2, $3, $4, $5)
+                """,
+                user_id,
+                email_hash,
+                password_hash,
+                journey_stage,
+                journey_started_at
+            )
 
-        await self.db_client.execute(
-            """
-            INSERT INTO users (id, email_hash, password_hash, journey_stage, journey_started_at)
-            VALUES ($1, $2, $3, $4, $5)
-            """,
-            user_id,
-            email_hash,
-            password_hash,
-            journey_stage,
-            journey_started_at
-        )
+        await self._cache_user_exists(email_hash)
+
+    async def _cache_user_exists(self, email_hash: str) -> None:
+        # Overwrites any cached "0" the moment the row exists, so a signup
+        # retried within the TTL window still gets its 409 from the cache.
+        redis = self._redis
+        if redis is not None:
+            await redis.set(
+                self._exists_key(email_hash), "1",
+                ex=USER_EXISTS_CACHE_TTL_SECONDS
+            )
 
     async def get_user_by_id(self, user_id: UUID) -> Optional[UserDB]:
         row = await self.db_client.fetchRow(
-            "SELECT * FROM users WHERE id = $1",
+            """
+            SELECT id, email_hash, password_hash, journey_stage, journey_started_at, created_at, updated_at
+            FROM users WHERE id = $1
+            """,
             user_id
         )
         return optional_record_to_model(row, UserDB)
@@ -69,48 +132,35 @@ class UserRepository:
         entry_stage: str,
         journey_started_at: datetime
     ) -> None:
-        async with self.db_client.transaction() as tx:
-            # Create user
-            await tx.execute(
-                """
+        # Create user and initialize journey atomically in one statement:
+        # the four inserts run as data-modifying CTEs, replacing a
+        # 4-round-trip transaction with a single round-trip. FK checks fire
+        # at end of statement, so the dependent inserts are safe.
+        await self.db_client.execute(
+            """
+            WITH new_user AS (
                 INSERT INTO users (id, email_hash, password_hash, journey_stage, journey_started_at)
                 VALUES ($1, $2, $3, $4, $5)
-                """,
-                user_id,
-                email_hash,
-                password_hash,
-                entry_stage,
-                journey_started_at
-            )
-
-            await tx.execute(
-                """
+                RETURNING id
+            ), state AS (
                 INSERT INTO user_journey_state (user_id, current_stage_id, visit_number, journey_started_at)
-                VALUES ($1, $2, 1, $3)
-                """,
-                user_id,
-                entry_stage,
-                journey_started_at
-            )
-
-            await tx.execute(
-                """
+                SELECT id, $4, 1, $5 FROM new_user
+            ), path AS (
                 INSERT INTO user_journey_path (user_id, stage_id, visit_number, is_current)
-                VALUES ($1, $2, 1, TRUE)
-                """,
-                user_id,
-                entry_stage
+                SELECT id, $4, 1, TRUE FROM new_user
             )
-
-            await tx.execute(
-                """
-                INSERT INTO stage_transitions (
-                    user_id, from_stage_id, to_stage_id, from_visit_number,
-                    to_visit_number, transition_reason
-                )
-                VALUES ($1, NULL, $2, NULL, 1, $3)
-                """,
-                user_id,
-                entry_stage,
-                "Initial signup"
+            INSERT INTO stage_transitions (
+                user_id, from_stage_id, to_stage_id, from_visit_number,
+                to_visit_number, transition_reason
             )
+            SELECT id, NULL, $4, NULL, 1, $6 FROM new_user
+            """,
+            user_id,
+            email_hash,
+            password_hash,
+            entry_stage,
+            journey_started_at,
+            "Initial signup"
+        )
+
+        await self._cache_user_exists(email_hash)
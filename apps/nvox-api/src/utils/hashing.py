@@ -1,15 +1,50 @@
+import asyncio
 import hashlib
+import hmac
+import os
 import bcrypt
 
+# Optional pepper for the deterministic email lookup hash. When set, the
+# hash becomes an HMAC so the mapping can't be recomputed without the key.
+# hashlib/hmac bind to OpenSSL, which dispatches to hardware SHA extensions
+# where available, so either way the hash stays cheap.
+_EMAIL_HASH_PEPPER = os.getenv("EMAIL_HASH_PEPPER", "").encode()
+
 
 def hash_email(email: str) -> str:
+    if _EMAIL_HASH_PEPPER:
+        return hmac.new(_EMAIL_HASH_PEPPER, email.encode(), hashlib.sha256).hexdigest()
     return hashlib.sha256(email.encode()).hexdigest()
 
 
+# bcrypt work factor. Production stays on the library default (12); the test
+# suite dials this down since KDF hardness only costs wall time there.
+_BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+
 def hash_password(password: str) -> str:
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)
     return bcrypt.hashpw(password.encode(), salt).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+
+
+# Async wrappers for the request path. A bcrypt call at production cost
+# takes tens of ms; run synchronously it would stall the event loop and
+# every in-flight request with it. bcrypt's C extension releases the GIL
+# while hashing, so the loop's default thread pool gives real parallelism
+# without process-pool fork and pickle overhead. hash_email has no async
+# wrapper: a single SHA-256 is cheaper than the executor hop.
+
+async def hash_password_async(password: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(
+        None, hash_password, password
+    )
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await asyncio.get_running_loop().run_in_executor(
+        None, verify_password, plain_password, hashed_password
+    )
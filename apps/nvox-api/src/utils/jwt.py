@@ -1,13 +1,24 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID, uuid4
-from jose import JWTError, jwt
 import os
 
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "change_me_in_production_use_strong_secret_key")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# jose pulls in the cryptography backends at import time (~tens of ms), so
+# defer it to first use and cache the module references.
+_jose = None
+
+
+def _get_jose():
+    global _jose
+    if _jose is None:
+        from jose import JWTError, jwt
+        _jose = (jwt, JWTError)
+    return _jose
+
 
 def create_access_token(user_id: UUID, email_hash: str, expires_delta: Optional[timedelta] = None) -> tuple[str, str, datetime]:
     if expires_delta is None:
@@ -24,11 +35,13 @@ def create_access_token(user_id: UUID, email_hash: str, expires_delta: Optional[
         "iat": datetime.utcnow(),  # Issued at
     }
 
+    jwt, _ = _get_jose()
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt, jti, expire
 
 
 def decode_access_token(token: str) -> Optional[dict]:
+    jwt, JWTError = _get_jose()
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
@@ -37,8 +50,11 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 
-def get_user_id_from_token(token: str) -> Optional[UUID]:
-    payload = decode_access_token(token)
+def get_user_id_from_token(token: str, payload: Optional[dict] = None) -> Optional[UUID]:
+    # Accept a pre-decoded payload so callers that already verified the
+    # token don't pay for another HMAC verification.
+    if payload is None:
+        payload = decode_access_token(token)
     if payload is None:
         return None
 
@@ -51,8 +67,9 @@ def get_user_id_from_token(token: str) -> Optional[UUID]:
         return None
 
 
-def get_token_expiration(token: str) -> Optional[datetime]:
-    payload = decode_access_token(token)
+def get_token_expiration(token: str, payload: Optional[dict] = None) -> Optional[datetime]:
+    if payload is None:
+        payload = decode_access_token(token)
     if payload is None:
         return None
 
@@ -63,8 +80,9 @@ def get_token_expiration(token: str) -> Optional[datetime]:
     return datetime.utcfromtimestamp(exp_timestamp)
 
 
-def get_jti_from_token(token: str) -> Optional[str]:
-    payload = decode_access_token(token)
+def get_jti_from_token(token: str, payload: Optional[dict] = None) -> Optional[str]:
+    if payload is None:
+        payload = decode_access_token(token)
     if payload is None:
         return None
 
@@ -1,44 +1,148 @@
 import dependencies.db as db_deps
 from repositories.user_repository import UserRepository
 from repositories.journey_repository import JourneyRepository
-from nvox_common.db.nvox_db_client import NvoxDBClient
-from main import app
+from repositories.session_repository import SessionRepository
+from nvox_common.db.nvox_db_client import TransactionClient
+from utils.hashing import hash_email, hash_password
+from utils.jwt import create_access_token
 import pytest
-import sys
+from datetime import datetime
 from pathlib import Path
 from typing import AsyncGenerator
+from uuid import uuid4
 from httpx import AsyncClient, ASGITransport
 from journey.config_loader import JourneyConfig, load_journey_config
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 pytest_plugins = ["nvox_common.db.tests.conftest"]
 
 
+def pytest_collection_modifyitems(items):
+    # Tag every test whose fixture closure reaches the test database. With
+    # the db tests deselected (`pytest -m "not db"`) the db_pool fixture is
+    # never instantiated, so the validation and pure-unit tests run without
+    # starting the PostgreSQL container at all.
+    for item in items:
+        if "db_pool" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.db)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    # Run the async tests on uvloop when available: httpx and asyncpg both
+    # spend their time in awaits, and uvloop's C event loop trims the
+    # per-await overhead. Falls back to the default policy silently.
+    try:
+        import uvloop
+    except ImportError:
+        import asyncio
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    # Signup-heavy tests are dominated by the bcrypt KDF at production cost;
+    # rounds=4 keeps hash/verify semantics while cutting each call to ~1 ms.
+    import utils.hashing as hashing
+
+    original_rounds = hashing._BCRYPT_ROUNDS
+    hashing._BCRYPT_ROUNDS = 4
+    yield
+    hashing._BCRYPT_ROUNDS = original_rounds
+
+
+@pytest.fixture(scope="function")
+def db_client(clean_db) -> TransactionClient:
+    # One shared client per test, bound to the clean_db transaction
+    # connection so every write made through the app or the repositories is
+    # rolled back on teardown.
+    return TransactionClient(clean_db)
+
+
 @pytest.fixture(scope="function")
-def user_repository(db_pool) -> UserRepository:
-    db_client = NvoxDBClient(db_pool)
+def user_repository(db_client) -> UserRepository:
     return UserRepository(db_client)
 
 
 @pytest.fixture(scope="function")
-def journey_repository(db_pool) -> JourneyRepository:
-    db_client = NvoxDBClient(db_pool)
+def journey_repository(db_client) -> JourneyRepository:
     return JourneyRepository(db_client)
 
 
+@pytest.fixture(scope="function")
+def make_user(db_client):
+    # Authenticated-user factory for journey tests. Creating the user and
+    # its session through the repositories skips the signup and login HTTP
+    # round-trips and the login-side bcrypt verify; the resulting token is
+    # indistinguishable from one minted by /v1/login. Results are cached by
+    # email so repeated calls within a test are free.
+    user_repository = UserRepository(db_client)
+    session_repository = SessionRepository(db_client)
+    users: dict[str, dict] = {}
+
+    async def _make(email: str, password: str = "TestPass1") -> dict:
+        if email in users:
+            return users[email]
+
+        user_id = uuid4()
+        email_hash = hash_email(email.lower())
+        await user_repository.create_user_with_journey(
+            user_id=user_id,
+            email_hash=email_hash,
+            password_hash=hash_password(password),
+            entry_stage="REFERRAL",
+            journey_started_at=datetime.utcnow(),
+        )
+        token, jti, expires_at = create_access_token(user_id, email_hash)
+        await session_repository.create_session(user_id, jti, expires_at)
+
+        users[email] = {"user_id": str(user_id), "email": email, "token": token}
+        return users[email]
+
+    return _make
+
+
 @pytest.fixture(scope="function")
 async def journey_config():
     config_path = Path(__file__).parent.parent / "config" / "journey_config.json"
     return await load_journey_config(config_path, redis_client=None)
 
 
+@pytest.fixture(scope="session")
+def asgi_transport() -> ASGITransport:
+    # In-process ASGI dispatch: requests call straight into the app with no
+    # socket, TCP handshake or HTTP parsing on a real server. The transport
+    # is stateless (per-test state lives in app.dependency_overrides), so
+    # one instance serves the whole session; it is also where the app import
+    # cost is paid, once, and only by tests that actually use the API.
+    from main import app
+
+    return ASGITransport(app=app)
+
+
 @pytest.fixture(scope="function")
-async def test_client(db_pool, journey_config) -> AsyncGenerator[AsyncClient, None]:
-    app.dependency_overrides[db_deps.get_db_client] = lambda: NvoxDBClient(db_pool)
+async def test_client(asgi_transport, db_client, journey_config) -> AsyncGenerator[AsyncClient, None]:
+    from main import app
+
+    app.dependency_overrides[db_deps.get_db_client] = lambda: db_client
+
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
+        yield client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+async def validation_client(asgi_transport, journey_config) -> AsyncGenerator[AsyncClient, None]:
+    # Client for pure request-validation tests. get_db_client is overridden
+    # with None: 422/401/403 responses are produced before any query runs,
+    # so these tests never need the PostgreSQL container and stay runnable
+    # under `pytest -m "not db"`.
+    from main import app
+
+    app.dependency_overrides[db_deps.get_db_client] = lambda: None
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
         yield client
 
     app.dependency_overrides.clear()
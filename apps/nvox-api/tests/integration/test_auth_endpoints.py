@@ -1,9 +1,28 @@
+import asyncio
 import pytest
 from httpx import AsyncClient
-from uuid import UUID
-import asyncpg
+from uuid import UUID, uuid4
 from jose import jwt
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+
+from repositories.user_repository import UserRepository
+from repositories.session_repository import SessionRepository
+from utils.hashing import hash_email, hash_password
+from utils.jwt import create_access_token
+
+# Constant by construction (timestamps are fixed in the past), so encode it
+# once at import instead of re-signing per test run.
+_EXPIRED_TOKEN = jwt.encode(
+    {
+        "sub": "00000000-0000-0000-0000-000000000000",
+        "email_hash": "test_hash",
+        "jti": "test_jti",
+        "exp": datetime(2020, 1, 1, tzinfo=timezone.utc),
+        "iat": datetime(2019, 12, 31, tzinfo=timezone.utc),
+    },
+    "dummy_secret",
+    algorithm="HS256",
+)
 
 
 @pytest.mark.asyncio
@@ -30,6 +49,10 @@ class TestSignupEndpoint:
 
         assert data["email"] != "newuser@example.com"
         assert len(data["email"]) == 64
+        assert data["email"].isalnum()
+
+        assert "password" not in data
+        assert "password_hash" not in data
 
     async def test_signup_duplicate_email_fails(self, test_client: AsyncClient, clean_db):
         payload = {
@@ -48,66 +71,35 @@ class TestSignupEndpoint:
         assert "already exists" in data["detail"].lower()
 
     async def test_signup_case_insensitive_email(self, test_client: AsyncClient, clean_db):
-        payload1 = {
-            "email": "Test@Example.com",
-            "password": "SecurePass1"
-        }
-        payload2 = {
-            "email": "test@example.com",
-            "password": "SecurePass2"
-        }
-
-        response1 = await test_client.post("/v1/signup", json=payload1)
-        assert response1.status_code == 201
-
-        response2 = await test_client.post("/v1/signup", json=payload2)
-        assert response2.status_code == 409
-
-    async def test_signup_invalid_password_too_long(self, test_client: AsyncClient, clean_db):
-        payload = {
-            "email": "test@example.com",
-            "password": "ThisPasswordIsTooLong123"
-        }
-
-        response = await test_client.post("/v1/signup", json=payload)
-        assert response.status_code == 422
-
-    async def test_signup_invalid_password_too_short(self, test_client: AsyncClient, clean_db):
-        payload = {
-            "email": "test@example.com",
-            "password": "short"
-        }
-
-        response = await test_client.post("/v1/signup", json=payload)
-        assert response.status_code == 422
+        # Seed the conflicting row directly; it only exists to collide on
+        # email_hash, so there is no need to run a full signup (and its
+        # bcrypt hash) just to populate it. The route lowercases the email
+        # before hashing, so the mixed-case signup must hit this row.
+        await clean_db.execute(
+            "INSERT INTO users (id, email_hash, password_hash) VALUES ($1, $2, $3)",
+            uuid4(), hash_email("test@example.com"), "$stub$"
+        )
 
-    async def test_signup_invalid_email_format(self, test_client: AsyncClient, clean_db):
-        payload = {
-            "email": "not-an-email",
-            "password": "SecurePass1"
-        }
-
-        response = await test_client.post("/v1/signup", json=payload)
-        assert response.status_code == 422
-
-    async def test_signup_missing_email(self, test_client: AsyncClient, clean_db):
         payload = {
+            "email": "Test@Example.com",
             "password": "SecurePass1"
         }
-
         response = await test_client.post("/v1/signup", json=payload)
-        assert response.status_code == 422
-
-    async def test_signup_missing_password(self, test_client: AsyncClient, clean_db):
-        payload = {
-            "email": "test@example.com"
-        }
-
-        response = await test_client.post("/v1/signup", json=payload)
-        assert response.status_code == 422
-
-    async def test_signup_empty_payload(self, test_client: AsyncClient, clean_db):
-        response = await test_client.post("/v1/signup", json={})
+        assert response.status_code == 409
+
+    # Pure-validation cases: every payload is rejected with 422 before any
+    # DB access, so they collapse into one parametrized test with no direct
+    # clean_db dependency.
+    @pytest.mark.parametrize("payload", [
+        pytest.param({"email": "test@example.com", "password": "ThisPasswordIsTooLong123"}, id="password_too_long"),
+        pytest.param({"email": "test@example.com", "password": "short"}, id="password_too_short"),
+        pytest.param({"email": "not-an-email", "password": "SecurePass1"}, id="invalid_email_format"),
+        pytest.param({"password": "SecurePass1"}, id="missing_email"),
+        pytest.param({"email": "test@example.com"}, id="missing_password"),
+        pytest.param({}, id="empty_payload"),
+    ])
+    async def test_signup_rejects_invalid_payload(self, validation_client: AsyncClient, payload):
+        response = await validation_client.post("/v1/signup", json=payload)
         assert response.status_code == 422
 
     async def test_signup_multiple_users(self, test_client: AsyncClient, clean_db):
@@ -117,49 +109,18 @@ class TestSignupEndpoint:
             {"email": "user3@example.com", "password": "Pass3word"},
         ]
 
-        for user in users:
-            response = await test_client.post("/v1/signup", json=user)
+        # Concurrent signups: the event loop overlaps the three requests'
+        # round-trips instead of paying them back to back.
+        responses = await asyncio.gather(
+            *(test_client.post("/v1/signup", json=user) for user in users)
+        )
+
+        for response in responses:
             assert response.status_code == 201
 
             data = response.json()
             assert data["success"] is True
 
-    async def test_signup_password_not_returned(self, test_client: AsyncClient, clean_db):
-        payload = {
-            "email": "secure@example.com",
-            "password": "SecurePass1"
-        }
-
-        response = await test_client.post("/v1/signup", json=payload)
-        data = response.json()
-
-        assert "password" not in data
-        assert "password_hash" not in data
-
-    async def test_signup_returns_hashed_email(self, test_client: AsyncClient, clean_db):
-        payload = {
-            "email": "hash@example.com",
-            "password": "SecurePass1"
-        }
-
-        response = await test_client.post("/v1/signup", json=payload)
-        data = response.json()
-
-        assert data["email"] != "hash@example.com"
-        assert len(data["email"]) == 64
-        assert data["email"].isalnum()
-
-    async def test_signup_sets_default_journey_stage(self, test_client: AsyncClient, clean_db):
-        payload = {
-            "email": "journey@example.com",
-            "password": "SecurePass1"
-        }
-
-        response = await test_client.post("/v1/signup", json=payload)
-        data = response.json()
-
-        assert data["journey"]["current_stage"] == "REFERRAL"
-
     async def test_signup_generates_unique_user_ids(self, test_client: AsyncClient, clean_db):
         payload1 = {"email": "uuid1@example.com", "password": "SecurePass1"}
         payload2 = {"email": "uuid2@example.com", "password": "SecurePass2"}
@@ -179,16 +140,24 @@ class TestSignupEndpoint:
 
 @pytest.mark.asyncio
 class TestLoginEndpoint:
-    async def test_login_success(self, test_client: AsyncClient, clean_db):
-        signup_payload = {
-            "email": "login@example.com",
+    # One signed-up user for the whole class. Function scope is deliberate:
+    # each test runs in its own rolled-back transaction (clean_db), so a
+    # class-scoped row would disappear at the first teardown. The per-signup
+    # KDF cost is kept low by the reduced bcrypt rounds used in tests.
+    @pytest.fixture
+    async def login_user(self, test_client: AsyncClient, clean_db) -> dict:
+        payload = {
+            "email": "login-user@example.com",
             "password": "SecurePass1"
         }
-        await test_client.post("/v1/signup", json=signup_payload)
+        response = await test_client.post("/v1/signup", json=payload)
+        assert response.status_code == 201
+        return {**payload, "user_id": response.json()["user_id"]}
 
+    async def test_login_success(self, test_client: AsyncClient, login_user):
         login_payload = {
-            "email": "login@example.com",
-            "password": "SecurePass1"
+            "email": login_user["email"],
+            "password": login_user["password"]
         }
         response = await test_client.post("/v1/login", json=login_payload)
 
@@ -207,15 +176,9 @@ class TestLoginEndpoint:
 
         UUID(data["user_id"])
 
-    async def test_login_with_wrong_password(self, test_client: AsyncClient, clean_db):
-        signup_payload = {
-            "email": "wrongpass@example.com",
-            "password": "CorrectPass1"
-        }
-        await test_client.post("/v1/signup", json=signup_payload)
-
+    async def test_login_with_wrong_password(self, test_client: AsyncClient, login_user):
         login_payload = {
-            "email": "wrongpass@example.com",
+            "email": login_user["email"],
             "password": "WrongPass1"
         }
         response = await test_client.post("/v1/login", json=login_payload)
@@ -236,16 +199,10 @@ class TestLoginEndpoint:
         data = response.json()
         assert data["detail"] == "Invalid credentials"
 
-    async def test_login_case_insensitive_email(self, test_client: AsyncClient, clean_db):
-        signup_payload = {
-            "email": "case@example.com",
-            "password": "SecurePass1"
-        }
-        await test_client.post("/v1/signup", json=signup_payload)
-
+    async def test_login_case_insensitive_email(self, test_client: AsyncClient, login_user):
         login_payload = {
-            "email": "CASE@EXAMPLE.COM",
-            "password": "SecurePass1"
+            "email": login_user["email"].upper(),
+            "password": login_user["password"]
         }
         response = await test_client.post("/v1/login", json=login_payload)
 
@@ -253,41 +210,34 @@ class TestLoginEndpoint:
         data = response.json()
         assert data["success"] is True
 
-    async def test_login_creates_session_in_database(self, test_client: AsyncClient, clean_db, db_pool: asyncpg.Pool):
-        signup_payload = {
-            "email": "session@example.com",
-            "password": "SecurePass1"
-        }
-        signup_response = await test_client.post("/v1/signup", json=signup_payload)
-        user_id = signup_response.json()["user_id"]
+    async def test_login_creates_session_in_database(self, test_client: AsyncClient, clean_db, login_user):
+        uid = UUID(login_user["user_id"])
 
         login_payload = {
-            "email": "session@example.com",
-            "password": "SecurePass1"
+            "email": login_user["email"],
+            "password": login_user["password"]
         }
         login_response = await test_client.post("/v1/login", json=login_payload)
 
         assert login_response.status_code == 200
-        async with db_pool.acquire() as conn:
-            sessions = await conn.fetch(
-                "SELECT * FROM sessions WHERE user_id = $1 AND is_active = TRUE",
-                UUID(user_id)
-            )
-            assert len(sessions) == 1
-            session = sessions[0]
-            assert session["is_active"] is True
-            assert session["revoked_at"] is None
-
-    async def test_login_password_not_returned(self, test_client: AsyncClient, clean_db):
-        signup_payload = {
-            "email": "secure@example.com",
-            "password": "SecurePass1"
-        }
-        await test_client.post("/v1/signup", json=signup_payload)
-
+        # Assertions go through the clean_db connection: the test runs in a
+        # rolled-back transaction, so other connections can't see its rows.
+        session_count = await clean_db.fetchval(
+            "SELECT COUNT(*) FROM sessions WHERE user_id = $1 AND is_active = TRUE",
+            uid
+        )
+        assert session_count == 1
+        session = await clean_db.fetchrow(
+            "SELECT is_active, revoked_at FROM sessions WHERE user_id = $1 AND is_active = TRUE",
+            uid
+        )
+        assert session["is_active"] is True
+        assert session["revoked_at"] is None
+
+    async def test_login_password_not_returned(self, test_client: AsyncClient, login_user):
         login_payload = {
-            "email": "secure@example.com",
-            "password": "SecurePass1"
+            "email": login_user["email"],
+            "password": login_user["password"]
         }
         response = await test_client.post("/v1/login", json=login_payload)
 
@@ -295,76 +245,68 @@ class TestLoginEndpoint:
         assert "password" not in data
         assert "password_hash" not in data
 
-    async def test_login_invalid_email_format(self, test_client: AsyncClient, clean_db):
-        login_payload = {
-            "email": "not-an-email",
-            "password": "SecurePass1"
-        }
-        response = await test_client.post("/v1/login", json=login_payload)
-
-        assert response.status_code == 422
-
-    async def test_login_missing_email(self, test_client: AsyncClient, clean_db):
-        login_payload = {
-            "password": "SecurePass1"
-        }
-        response = await test_client.post("/v1/login", json=login_payload)
-
-        assert response.status_code == 422
-
-    async def test_login_missing_password(self, test_client: AsyncClient, clean_db):
-        login_payload = {
-            "email": "test@example.com"
-        }
-        response = await test_client.post("/v1/login", json=login_payload)
+    @pytest.mark.parametrize("login_payload", [
+        pytest.param({"email": "not-an-email", "password": "SecurePass1"}, id="invalid_email_format"),
+        pytest.param({"password": "SecurePass1"}, id="missing_email"),
+        pytest.param({"email": "test@example.com"}, id="missing_password"),
+        pytest.param({}, id="empty_payload"),
+    ])
+    async def test_login_rejects_invalid_payload(self, validation_client: AsyncClient, login_payload):
+        response = await validation_client.post("/v1/login", json=login_payload)
 
         assert response.status_code == 422
 
-    async def test_login_empty_payload(self, test_client: AsyncClient, clean_db):
-        response = await test_client.post("/v1/login", json={})
-
-        assert response.status_code == 422
-
-    async def test_login_multiple_times_creates_multiple_sessions(self, test_client: AsyncClient, clean_db, db_pool: asyncpg.Pool):
-        signup_payload = {
-            "email": "multisession@example.com",
-            "password": "SecurePass1"
-        }
-        signup_response = await test_client.post("/v1/signup", json=signup_payload)
-        user_id = signup_response.json()["user_id"]
+    async def test_login_multiple_times_creates_multiple_sessions(self, test_client: AsyncClient, clean_db, login_user):
+        uid = UUID(login_user["user_id"])
 
         login_payload = {
-            "email": "multisession@example.com",
-            "password": "SecurePass1"
+            "email": login_user["email"],
+            "password": login_user["password"]
         }
 
         for _ in range(3):
             response = await test_client.post("/v1/login", json=login_payload)
             assert response.status_code == 200
 
-        async with db_pool.acquire() as conn:
-            sessions = await conn.fetch(
-                "SELECT * FROM sessions WHERE user_id = $1 AND is_active = TRUE",
-                UUID(user_id)
-            )
-            assert len(sessions) == 3
+        session_count = await clean_db.fetchval(
+            "SELECT COUNT(*) FROM sessions WHERE user_id = $1 AND is_active = TRUE",
+            uid
+        )
+        assert session_count == 3
 
 
 @pytest.mark.asyncio
 class TestLogoutEndpoint:
-    async def test_logout_success(self, test_client: AsyncClient, clean_db):
-        signup_payload = {
-            "email": "logout@example.com",
-            "password": "SecurePass1"
-        }
-        await test_client.post("/v1/signup", json=signup_payload)
+    # Logout tests only exercise /v1/logout; the user and tokens they need
+    # are created straight through the repositories and the JWT helper, so
+    # setup skips the full signup/login HTTP stack.
+    @pytest.fixture
+    def auth_tokens(self, db_client):
+        user_repository = UserRepository(db_client)
+        session_repository = SessionRepository(db_client)
+
+        async def _mint(n: int = 1) -> tuple[str, list[str]]:
+            user_id = uuid4()
+            email_hash = hash_email(f"logout-{user_id}@example.com")
+            await user_repository.create_user_with_journey(
+                user_id=user_id,
+                email_hash=email_hash,
+                password_hash=hash_password("SecurePass1"),
+                entry_stage="REFERRAL",
+                journey_started_at=datetime.utcnow()
+            )
 
-        login_payload = {
-            "email": "logout@example.com",
-            "password": "SecurePass1"
-        }
-        login_response = await test_client.post("/v1/login", json=login_payload)
-        access_token = login_response.json()["access_token"]
+            tokens = []
+            for _ in range(n):
+                token, jti, expires_at = create_access_token(user_id, email_hash)
+                await session_repository.create_session(user_id, jti, expires_at)
+                tokens.append(token)
+            return str(user_id), tokens
+
+        return _mint
+
+    async def test_logout_success(self, test_client: AsyncClient, auth_tokens):
+        _, (access_token,) = await auth_tokens()
 
         headers = {"Authorization": f"Bearer {access_token}"}
         response = await test_client.post("/v1/logout", headers=headers)
@@ -374,90 +316,53 @@ class TestLogoutEndpoint:
         assert data["success"] is True
         assert data["message"] == "Logged out successfully"
 
-    async def test_logout_without_token(self, test_client: AsyncClient, clean_db):
-        response = await test_client.post("/v1/logout")
+    async def test_logout_without_token(self, validation_client: AsyncClient):
+        response = await validation_client.post("/v1/logout")
 
         assert response.status_code == 403
 
-    async def test_logout_with_invalid_token(self, test_client: AsyncClient, clean_db):
+    async def test_logout_with_invalid_token(self, validation_client: AsyncClient):
         headers = {"Authorization": "Bearer invalid_token_here"}
-        response = await test_client.post("/v1/logout", headers=headers)
+        response = await validation_client.post("/v1/logout", headers=headers)
 
         assert response.status_code == 401
         data = response.json()
         assert "detail" in data
 
-    async def test_logout_with_expired_token(self, test_client: AsyncClient, clean_db):
-        expired_payload = {
-            "sub": "00000000-0000-0000-0000-000000000000",
-            "email_hash": "test_hash",
-            "jti": "test_jti",
-            "exp": datetime.utcnow() - timedelta(hours=1),
-            "iat": datetime.utcnow() - timedelta(hours=2)
-        }
-
-        expired_token = jwt.encode(expired_payload, "dummy_secret", algorithm="HS256")
-
-        headers = {"Authorization": f"Bearer {expired_token}"}
-        response = await test_client.post("/v1/logout", headers=headers)
+    async def test_logout_with_expired_token(self, validation_client: AsyncClient):
+        headers = {"Authorization": f"Bearer {_EXPIRED_TOKEN}"}
+        response = await validation_client.post("/v1/logout", headers=headers)
 
         assert response.status_code == 401
 
-    async def test_logout_revokes_all_user_sessions(self, test_client: AsyncClient, clean_db, db_pool: asyncpg.Pool):
-        signup_payload = {
-            "email": "revokeall@example.com",
-            "password": "SecurePass1"
-        }
-        signup_response = await test_client.post("/v1/signup", json=signup_payload)
-        user_id = signup_response.json()["user_id"]
+    async def test_logout_revokes_all_user_sessions(self, test_client: AsyncClient, clean_db, auth_tokens):
+        user_id, tokens = await auth_tokens(3)
+        uid = UUID(user_id)
 
-        login_payload = {
-            "email": "revokeall@example.com",
-            "password": "SecurePass1"
-        }
-
-        tokens = []
-        for _ in range(3):
-            response = await test_client.post("/v1/login", json=login_payload)
-            tokens.append(response.json()["access_token"])
-
-        async with db_pool.acquire() as conn:
-            active_sessions_before = await conn.fetch(
-                "SELECT * FROM sessions WHERE user_id = $1 AND is_active = TRUE",
-                UUID(user_id)
-            )
-            assert len(active_sessions_before) == 3
+        active_sessions_before = await clean_db.fetchval(
+            "SELECT COUNT(*) FROM sessions WHERE user_id = $1 AND is_active = TRUE",
+            uid
+        )
+        assert active_sessions_before == 3
 
         headers = {"Authorization": f"Bearer {tokens[0]}"}
         response = await test_client.post("/v1/logout", headers=headers)
         assert response.status_code == 200
 
-        async with db_pool.acquire() as conn:
-            active_sessions_after = await conn.fetch(
-                "SELECT * FROM sessions WHERE user_id = $1 AND is_active = TRUE",
-                UUID(user_id)
-            )
-            assert len(active_sessions_after) == 0
-
-            revoked_sessions = await conn.fetch(
-                "SELECT * FROM sessions WHERE user_id = $1 AND is_active = FALSE",
-                UUID(user_id)
-            )
-            assert len(revoked_sessions) == 3
+        active_sessions_after = await clean_db.fetchval(
+            "SELECT COUNT(*) FROM sessions WHERE user_id = $1 AND is_active = TRUE",
+            uid
+        )
+        assert active_sessions_after == 0
 
-    async def test_logout_twice_fails(self, test_client: AsyncClient, clean_db):
-        signup_payload = {
-            "email": "doublelogout@example.com",
-            "password": "SecurePass1"
-        }
-        await test_client.post("/v1/signup", json=signup_payload)
+        revoked_sessions = await clean_db.fetchval(
+            "SELECT COUNT(*) FROM sessions WHERE user_id = $1 AND is_active = FALSE",
+            uid
+        )
+        assert revoked_sessions == 3
 
-        login_payload = {
-            "email": "doublelogout@example.com",
-            "password": "SecurePass1"
-        }
-        login_response = await test_client.post("/v1/login", json=login_payload)
-        access_token = login_response.json()["access_token"]
+    async def test_logout_twice_fails(self, test_client: AsyncClient, auth_tokens):
+        _, (access_token,) = await auth_tokens()
 
         headers = {"Authorization": f"Bearer {access_token}"}
         response1 = await test_client.post("/v1/logout", headers=headers)
@@ -467,8 +372,8 @@ class TestLogoutEndpoint:
         data = response2.json()
         assert "revoked" in data["detail"].lower()
 
-    async def test_logout_with_malformed_authorization_header(self, test_client: AsyncClient, clean_db):
+    async def test_logout_with_malformed_authorization_header(self, validation_client: AsyncClient):
         headers = {"Authorization": "some_token"}
-        response = await test_client.post("/v1/logout", headers=headers)
+        response = await validation_client.post("/v1/logout", headers=headers)
 
         assert response.status_code == 403
@@ -3,26 +3,13 @@ from httpx import AsyncClient
 
 
 @pytest.fixture
-async def authenticated_user_with_journey(test_client: AsyncClient, sample_email, sample_password):
-    response = await test_client.post(
-        "/v1/signup",
-        json={"email": sample_email, "password": sample_password}
-    )
-    assert response.status_code == 201
-    data = response.json()
-
-    login_response = await test_client.post(
-        "/v1/login",
-        json={"email": sample_email, "password": sample_password}
-    )
-    assert login_response.status_code == 200
-    token_data = login_response.json()
-
-    return {
-        "user_id": data["user_id"],
-        "token": token_data["access_token"],
-        "email": sample_email
-    }
+async def authenticated_user_with_journey(make_user, sample_email):
+    # Built through the repository-level factory rather than signup+login
+    # HTTP calls: same journey state and a token the auth dependency accepts,
+    # minus two round-trips and a bcrypt verify per test. It stays
+    # function-scoped because each test's transaction rollback would discard
+    # a module-scoped user's rows after the first test.
+    return await make_user(sample_email)
 
 
 @pytest.mark.asyncio
@@ -43,10 +30,11 @@ async def test_signup_initializes_journey(test_client: AsyncClient, sample_email
 @pytest.mark.asyncio
 async def test_get_current_journey_success(test_client: AsyncClient, authenticated_user_with_journey):
     token = authenticated_user_with_journey["token"]
+    headers = {"Authorization": f"Bearer {token}"}
 
     response = await test_client.get(
         "/v1/journey/current",
-        headers={"Authorization": f"Bearer {token}"}
+        headers=headers
     )
 
     assert response.status_code == 200
@@ -67,10 +55,11 @@ async def test_get_current_journey_unauthorized(test_client: AsyncClient):
 @pytest.mark.asyncio
 async def test_submit_answer_boolean_no_transition(test_client: AsyncClient, authenticated_user_with_journey):
     token = authenticated_user_with_journey["token"]
+    headers = {"Authorization": f"Bearer {token}"}
 
     response = await test_client.post(
         "/v1/journey/answer",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
         json={
             "question_id": "ref_has_nephrologist_note",
             "answer_value": "yes"
@@ -88,10 +77,11 @@ async def test_submit_answer_boolean_no_transition(test_client: AsyncClient, aut
 @pytest.mark.asyncio
 async def test_submit_answer_with_transition(test_client: AsyncClient, authenticated_user_with_journey):
     token = authenticated_user_with_journey["token"]
+    headers = {"Authorization": f"Bearer {token}"}
 
     answer_response = await test_client.post(
         "/v1/journey/answer",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
         json={
             "question_id": "ref_karnofsky",
             "answer_value": 80.0
@@ -106,7 +96,7 @@ async def test_submit_answer_with_transition(test_client: AsyncClient, authentic
 
     continue_response = await test_client.post(
         "/v1/journey/continue",
-        headers={"Authorization": f"Bearer {token}"}
+        headers=headers
     )
     assert continue_response.status_code == 200
     data = continue_response.json()
@@ -118,22 +108,14 @@ async def test_submit_answer_with_transition(test_client: AsyncClient, authentic
 
 
 @pytest.mark.asyncio
-async def test_submit_answer_low_score_exit(test_client: AsyncClient):
-    response = await test_client.post(
-        "/v1/signup",
-        json={"email": "exit_test@example.com", "password": "TestPass1"}
-    )
-    assert response.status_code == 201
-
-    login_response = await test_client.post(
-        "/v1/login",
-        json={"email": "exit_test@example.com", "password": "TestPass1"}
-    )
-    token = login_response.json()["access_token"]
+async def test_submit_answer_low_score_exit(test_client: AsyncClient, make_user):
+    user = await make_user("exit_test@example.com")
+    token = user["token"]
+    headers = {"Authorization": f"Bearer {token}"}
 
     answer_response = await test_client.post(
         "/v1/journey/answer",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
         json={
             "question_id": "ref_karnofsky",
             "answer_value": 30.0
@@ -148,7 +130,7 @@ async def test_submit_answer_low_score_exit(test_client: AsyncClient):
 
     continue_response = await test_client.post(
         "/v1/journey/continue",
-        headers={"Authorization": f"Bearer {token}"}
+        headers=headers
     )
     assert continue_response.status_code == 200
     data = continue_response.json()
@@ -160,10 +142,11 @@ async def test_submit_answer_low_score_exit(test_client: AsyncClient):
 @pytest.mark.asyncio
 async def test_submit_answer_invalid_question(test_client: AsyncClient, authenticated_user_with_journey):
     token = authenticated_user_with_journey["token"]
+    headers = {"Authorization": f"Bearer {token}"}
 
     response = await test_client.post(
         "/v1/journey/answer",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
         json={
             "question_id": "nonexistent_question",
             "answer_value": 50.0
@@ -178,10 +161,11 @@ async def test_submit_answer_invalid_question(test_client: AsyncClient, authenti
 @pytest.mark.asyncio
 async def test_submit_answer_invalid_value(test_client: AsyncClient, authenticated_user_with_journey):
     token = authenticated_user_with_journey["token"]
+    headers = {"Authorization": f"Bearer {token}"}
 
     response = await test_client.post(
         "/v1/journey/answer",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
         json={
             "question_id": "ref_karnofsky",
             "answer_value": 150.0
@@ -197,17 +181,18 @@ async def test_submit_answer_invalid_value(test_client: AsyncClient, authenticat
 @pytest.mark.asyncio
 async def test_submit_answer_updates_existing(test_client: AsyncClient, authenticated_user_with_journey):
     token = authenticated_user_with_journey["token"]
+    headers = {"Authorization": f"Bearer {token}"}
 
     response1 = await test_client.post(
         "/v1/journey/answer",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
         json={"question_id": "ref_karnofsky", "answer_value": 70.0}
     )
     assert response1.status_code == 200
 
     response2 = await test_client.post(
         "/v1/journey/answer",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
         json={"question_id": "ref_karnofsky", "answer_value": 80.0}
     )
     assert response2.status_code == 200
@@ -218,17 +203,18 @@ async def test_submit_answer_updates_existing(test_client: AsyncClient, authenti
 @pytest.mark.asyncio
 async def test_delete_user_anonymizes_data(test_client: AsyncClient, authenticated_user_with_journey):
     token = authenticated_user_with_journey["token"]
+    headers = {"Authorization": f"Bearer {token}"}
     original_email = authenticated_user_with_journey["email"]
 
     await test_client.post(
         "/v1/journey/answer",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
         json={"question_id": "ref_karnofsky", "answer_value": 80.0}
     )
 
     response = await test_client.delete(
         "/v1/user",
-        headers={"Authorization": f"Bearer {token}"}
+        headers=headers
     )
 
     assert response.status_code == 200
@@ -244,43 +230,37 @@ async def test_delete_user_anonymizes_data(test_client: AsyncClient, authenticat
 
 
 @pytest.mark.asyncio
-async def test_journey_flow_complete_path(test_client: AsyncClient):
-    signup_response = await test_client.post(
-        "/v1/signup",
-        json={"email": "journey_flow@example.com", "password": "TestPass1"}
-    )
-    assert signup_response.status_code == 201
-
-    login_response = await test_client.post(
-        "/v1/login",
-        json={"email": "journey_flow@example.com", "password": "TestPass1"}
-    )
-    token = login_response.json()["access_token"]
+async def test_journey_flow_complete_path(test_client: AsyncClient, make_user):
+    user = await make_user("journey_flow@example.com")
+    token = user["token"]
+    headers = {"Authorization": f"Bearer {token}"}
 
     current_response = await test_client.get(
         "/v1/journey/current",
-        headers={"Authorization": f"Bearer {token}"}
+        headers=headers
     )
     assert current_response.json()["current_stage"] == "REFERRAL"
 
     answer_response = await test_client.post(
         "/v1/journey/answer",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
         json={"question_id": "ref_karnofsky", "answer_value": 80.0}
     )
-    assert answer_response.json()["current_stage"] == "REFERRAL"
-    assert not answer_response.json()["transitioned"]
+    answer_data = answer_response.json()
+    assert answer_data["current_stage"] == "REFERRAL"
+    assert not answer_data["transitioned"]
 
     continue_response = await test_client.post(
         "/v1/journey/continue",
-        headers={"Authorization": f"Bearer {token}"}
+        headers=headers
     )
-    assert continue_response.json()["transitioned"]
-    assert continue_response.json()["current_stage"] == "WORKUP"
+    continue_data = continue_response.json()
+    assert continue_data["transitioned"]
+    assert continue_data["current_stage"] == "WORKUP"
 
     current_response = await test_client.get(
         "/v1/journey/current",
-        headers={"Authorization": f"Bearer {token}"}
+        headers=headers
     )
     current_data = current_response.json()
     assert current_data["current_stage"] == "WORKUP"
@@ -2,7 +2,7 @@ import pytest
 from journey.config_loader import JourneyConfig, Stage, Question
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_config_json():
     return """
 {
@@ -38,63 +38,52 @@ def sample_config_json():
 """
 
 
-def test_question_validation_number_valid():
-    question = Question({"id": "q1", "text": "Test", "type": "number", "constraints": {"min": 0, "max": 100}})
-    is_valid, error = question.validate_answer(50)
-    assert is_valid
-    assert error is None
-
-
-def test_question_validation_number_too_low():
-    question = Question({"id": "q1", "text": "Test", "type": "number", "constraints": {"min": 0, "max": 100}})
-    is_valid, error = question.validate_answer(-10)
-    assert not is_valid
-    assert "must be >=" in error
-
-
-def test_question_validation_number_too_high():
-    question = Question({"id": "q1", "text": "Test", "type": "number", "constraints": {"min": 0, "max": 100}})
-    is_valid, error = question.validate_answer(150)
-    assert not is_valid
-    assert "must be <=" in error
-
-
-def test_question_validation_boolean_valid():
-    question = Question({"id": "q1", "text": "Test", "type": "boolean"})
-    assert question.validate_answer(True)[0]
-    assert question.validate_answer(False)[0]
-    assert question.validate_answer(1)[0]
-    assert question.validate_answer(0)[0]
-
-
-def test_question_validation_boolean_invalid():
-    question = Question({"id": "q1", "text": "Test", "type": "boolean"})
-    is_valid, error = question.validate_answer(2)
-    assert not is_valid
-    assert "must be 0 or 1" in error
-
-
-def test_question_validation_select_valid():
-    question = Question({
-        "id": "q1",
-        "text": "Test",
-        "type": "select",
-        "options": [{"value": "A", "label": "Option A"}, {"value": "B", "label": "Option B"}]
-    })
-    assert question.validate_answer("A")[0]
-    assert question.validate_answer("B")[0]
-
-
-def test_question_validation_select_invalid():
-    question = Question({
-        "id": "q1",
-        "text": "Test",
-        "type": "select",
-        "options": [{"value": "A", "label": "Option A"}]
-    })
-    is_valid, error = question.validate_answer("C")
-    assert not is_valid
-    assert "must be one of" in error
+@pytest.fixture(scope="module")
+def parsed_config(sample_config_json) -> JourneyConfig:
+    # Parse once per module: the config tests only read from the object
+    # graph, so there is no need to re-run json.loads and the Stage/Question
+    # construction for every test.
+    return JourneyConfig.from_json_string(sample_config_json)
+
+
+# Shared instances: validate_answer never mutates the question, so the three
+# objects are built once at import instead of once per parametrized case.
+_NUMBER_Q = Question({"id": "q1", "text": "Test", "type": "number", "constraints": {"min": 0, "max": 100}})
+_BOOLEAN_Q = Question({"id": "q1", "text": "Test", "type": "boolean"})
+_SELECT_Q = Question({
+    "id": "q1",
+    "text": "Test",
+    "type": "select",
+    "options": [{"value": "A", "label": "Option A"}, {"value": "B", "label": "Option B"}],
+})
+
+
+# (question, answer, expected validity, expected error substring). One row
+# per case keeps the three question types' rules side by side.
+QUESTION_VALIDATION_CASES = [
+    pytest.param(_NUMBER_Q, 50, True, None, id="number_valid"),
+    pytest.param(_NUMBER_Q, -10, False, "must be >=", id="number_too_low"),
+    pytest.param(_NUMBER_Q, 150, False, "must be <=", id="number_too_high"),
+    pytest.param(_BOOLEAN_Q, True, True, None, id="boolean_true"),
+    pytest.param(_BOOLEAN_Q, False, True, None, id="boolean_false"),
+    pytest.param(_BOOLEAN_Q, 1, True, None, id="boolean_one"),
+    pytest.param(_BOOLEAN_Q, 0, True, None, id="boolean_zero"),
+    pytest.param(_BOOLEAN_Q, 2, False, "must be 0 or 1", id="boolean_invalid"),
+    pytest.param(_SELECT_Q, "A", True, None, id="select_first_option"),
+    pytest.param(_SELECT_Q, "B", True, None, id="select_second_option"),
+    pytest.param(_SELECT_Q, "C", False, "must be one of", id="select_invalid"),
+]
+
+
+@pytest.mark.parametrize("question,answer,expect_valid,expect_error", QUESTION_VALIDATION_CASES)
+def test_question_validate_answer(question, answer, expect_valid, expect_error):
+    is_valid, error = question.validate_answer(answer)
+
+    assert is_valid == expect_valid
+    if expect_error is None:
+        assert error is None
+    else:
+        assert expect_error in error
 
 
 def test_stage_get_question():
@@ -115,8 +104,8 @@ def test_stage_get_question():
     assert q_missing is None
 
 
-def test_journey_config_from_json_string(sample_config_json):
-    config = JourneyConfig.from_json_string(sample_config_json)
+def test_journey_config_from_json_string(parsed_config):
+    config = parsed_config
 
     assert config.version == "1.0"
     assert config.domain == "transplant_journey"
@@ -124,8 +113,8 @@ def test_journey_config_from_json_string(sample_config_json):
     assert len(config.stages) == 2
 
 
-def test_journey_config_get_stage(sample_config_json):
-    config = JourneyConfig.from_json_string(sample_config_json)
+def test_journey_config_get_stage(parsed_config):
+    config = parsed_config
 
     referral = config.get_stage("REFERRAL")
     assert referral is not None
@@ -137,8 +126,8 @@ def test_journey_config_get_stage(sample_config_json):
     assert missing is None
 
 
-def test_journey_config_get_question(sample_config_json):
-    config = JourneyConfig.from_json_string(sample_config_json)
+def test_journey_config_get_question(parsed_config):
+    config = parsed_config
 
     question = config.get_question("REFERRAL", "ref_karnofsky")
     assert question is not None
@@ -149,16 +138,16 @@ def test_journey_config_get_question(sample_config_json):
     assert missing is None
 
 
-def test_journey_config_validate_stage_exists(sample_config_json):
-    config = JourneyConfig.from_json_string(sample_config_json)
+def test_journey_config_validate_stage_exists(parsed_config):
+    config = parsed_config
 
     assert config.validate_stage_exists("REFERRAL")
     assert config.validate_stage_exists("EXIT")
     assert not config.validate_stage_exists("NONEXISTENT")
 
 
-def test_journey_config_get_all_stage_ids(sample_config_json):
-    config = JourneyConfig.from_json_string(sample_config_json)
+def test_journey_config_get_all_stage_ids(parsed_config):
+    config = parsed_config
 
     stage_ids = config.get_all_stage_ids()
     assert "REFERRAL" in stage_ids
@@ -4,120 +4,112 @@ from decimal import Decimal
 from journey.graph_models import JourneyEdge
 from repositories.graph_repository import GraphRepository
 from journey.routing_engine import RoutingEngine
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+
+
+# One edge per condition type, built once at import (matches() never
+# mutates the edge, and three uuid4() calls replace one per test).
+_RANGE_EDGE = JourneyEdge(
+    id=uuid4(),
+    from_node_id='REFERRAL',
+    to_node_id='WORKUP',
+    condition_type='range',
+    question_id='ref_karnofsky',
+    range_min=Decimal('40.0'),
+    range_max=Decimal('100.0')
+)
+
+_ALWAYS_EDGE = JourneyEdge(
+    id=uuid4(),
+    from_node_id=None,
+    to_node_id='REFERRAL',
+    condition_type='always',
+    question_id=None,
+    range_min=None,
+    range_max=None
+)
+
+_EQUALS_EDGE = JourneyEdge(
+    id=uuid4(),
+    from_node_id='DONOR',
+    to_node_id='BOARD',
+    condition_type='equals',
+    question_id='dnr_clearance',
+    range_min=Decimal('1.0'),
+    range_max=None
+)
+
+EDGE_MATCH_CASES = [
+    pytest.param(_RANGE_EDGE, 50, True, id="range_inside"),
+    pytest.param(_RANGE_EDGE, 40, True, id="range_min_inclusive"),
+    pytest.param(_RANGE_EDGE, 100, True, id="range_max_inclusive"),
+    pytest.param(_RANGE_EDGE, 39.999, False, id="range_below_min"),
+    pytest.param(_RANGE_EDGE, 100.001, False, id="range_above_max"),
+    pytest.param(_ALWAYS_EDGE, None, True, id="always_none"),
+    pytest.param(_ALWAYS_EDGE, 0, True, id="always_zero"),
+    pytest.param(_ALWAYS_EDGE, "anything", True, id="always_string"),
+    pytest.param(_EQUALS_EDGE, 1, True, id="equals_int"),
+    pytest.param(_EQUALS_EDGE, 1.0, True, id="equals_float"),
+    pytest.param(_EQUALS_EDGE, 0, False, id="equals_zero"),
+    pytest.param(_EQUALS_EDGE, 2, False, id="equals_other"),
+]
 
 
 class TestJourneyEdge:
-    def test_matches_range_condition(self):
-        edge = JourneyEdge(
-            id=uuid4(),
-            from_node_id='REFERRAL',
-            to_node_id='WORKUP',
-            condition_type='range',
-            question_id='ref_karnofsky',
-            range_min=Decimal('40.0'),
-            range_max=Decimal('100.0')
-        )
+    @pytest.mark.parametrize("edge,value,expected", EDGE_MATCH_CASES)
+    def test_matches(self, edge, value, expected):
+        assert edge.matches(value) is expected
 
-        assert edge.matches(50) is True
-        assert edge.matches(40) is True
-        assert edge.matches(100) is True
-        assert edge.matches(39.999) is False
-        assert edge.matches(100.001) is False
+    def test_edge_string_representation(self):
+        assert "REFERRAL → WORKUP" in str(_RANGE_EDGE)
+        assert "ref_karnofsky" in str(_RANGE_EDGE)
 
-    def test_matches_always_condition(self):
-        edge = JourneyEdge(
-            id=uuid4(),
-            from_node_id=None,
-            to_node_id='REFERRAL',
-            condition_type='always',
-            question_id=None,
-            range_min=None,
-            range_max=None
-        )
 
-        assert edge.matches(None) is True
-        assert edge.matches(0) is True
-        assert edge.matches("anything") is True
+# Edge rows as the repository would fetch them, built once at import. The
+# fakes below replace MagicMock/AsyncMock: the code under test only ever
+# calls fetch / find_matching_edge, and a plain object with that one async
+# method is cheaper to build and fails loudly on any unexpected access.
+_EDGE_TO_WORKUP_ROW = {
+    'id': uuid4(),
+    'from_node_id': 'BOARD',
+    'to_node_id': 'WORKUP',
+    'condition_type': 'range',
+    'question_id': 'brd_needs_more_tests',
+    'range_min': Decimal('1.0'),
+    'range_max': Decimal('1.0')
+}
 
-    def test_matches_equals_condition(self):
-        edge = JourneyEdge(
-            id=uuid4(),
-            from_node_id='DONOR',
-            to_node_id='BOARD',
-            condition_type='equals',
-            question_id='dnr_clearance',
-            range_min=Decimal('1.0'),
-            range_max=None
-        )
+_EDGE_TO_PREOP_ROW = {
+    'id': uuid4(),
+    'from_node_id': 'BOARD',
+    'to_node_id': 'PREOP',
+    'condition_type': 'range',
+    'question_id': 'brd_risk_score',
+    'range_min': Decimal('0.0'),
+    'range_max': Decimal('6.999')
+}
 
-        assert edge.matches(1) is True
-        assert edge.matches(1.0) is True
-        assert edge.matches(0) is False
-        assert edge.matches(2) is False
 
-    def test_edge_string_representation(self):
-        edge = JourneyEdge(
-            id=uuid4(),
-            from_node_id='REFERRAL',
-            to_node_id='WORKUP',
-            condition_type='range',
-            question_id='ref_karnofsky',
-            range_min=Decimal('40.0'),
-            range_max=Decimal('100.0')
-        )
+class FakeDBClient:
+    def __init__(self, rows):
+        self.rows = rows
 
-        assert "REFERRAL → WORKUP" in str(edge)
-        assert "ref_karnofsky" in str(edge)
+    async def fetch(self, query, *args):
+        return self.rows
 
 
-@pytest.mark.asyncio
-class TestGraphRepository:
-    async def test_find_matching_edge_with_revisit_priority(self):
-        db_client = MagicMock()
+class FakeGraphRepository:
+    def __init__(self, edge):
+        self.edge = edge
 
-        edge_to_workup = JourneyEdge(
-            id=uuid4(),
-            from_node_id='BOARD',
-            to_node_id='WORKUP',
-            condition_type='range',
-            question_id='brd_needs_more_tests',
-            range_min=Decimal('1.0'),
-            range_max=Decimal('1.0')
-        )
+    async def find_matching_edge(self, *args, **kwargs):
+        return self.edge
 
-        edge_to_preop = JourneyEdge(
-            id=uuid4(),
-            from_node_id='BOARD',
-            to_node_id='PREOP',
-            condition_type='range',
-            question_id='brd_risk_score',
-            range_min=Decimal('0.0'),
-            range_max=Decimal('6.999')
-        )
 
-        db_client.fetch = AsyncMock(return_value=[
-            {
-                'id': edge_to_workup.id,
-                'from_node_id': 'BOARD',
-                'to_node_id': 'WORKUP',
-                'condition_type': 'range',
-                'question_id': 'brd_needs_more_tests',
-                'range_min': Decimal('1.0'),
-                'range_max': Decimal('1.0')
-            },
-            {
-                'id': edge_to_preop.id,
-                'from_node_id': 'BOARD',
-                'to_node_id': 'PREOP',
-                'condition_type': 'range',
-                'question_id': 'brd_risk_score',
-                'range_min': Decimal('0.0'),
-                'range_max': Decimal('6.999')
-            }
-        ])
-
-        repo = GraphRepository(db_client)
+@pytest.mark.asyncio
+class TestGraphRepository:
+    async def test_find_matching_edge_with_revisit_priority(self):
+        repo = GraphRepository(FakeDBClient([_EDGE_TO_WORKUP_ROW, _EDGE_TO_PREOP_ROW]))
 
         answers = {
             'brd_needs_more_tests': 1,
@@ -133,31 +125,7 @@ class TestGraphRepository:
         assert matched_edge.question_id == 'brd_needs_more_tests'
 
     async def test_find_matching_edge_forward_when_no_revisit(self):
-        db_client = MagicMock()
-
-        edge_to_preop = JourneyEdge(
-            id=uuid4(),
-            from_node_id='BOARD',
-            to_node_id='PREOP',
-            condition_type='range',
-            question_id='brd_risk_score',
-            range_min=Decimal('0.0'),
-            range_max=Decimal('6.999')
-        )
-
-        db_client.fetch = AsyncMock(return_value=[
-            {
-                'id': edge_to_preop.id,
-                'from_node_id': 'BOARD',
-                'to_node_id': 'PREOP',
-                'condition_type': 'range',
-                'question_id': 'brd_risk_score',
-                'range_min': Decimal('0.0'),
-                'range_max': Decimal('6.999')
-            }
-        ])
-
-        repo = GraphRepository(db_client)
+        repo = GraphRepository(FakeDBClient([_EDGE_TO_PREOP_ROW]))
 
         answers = {'brd_risk_score': 5}
         visit_history = ['REFERRAL', 'WORKUP', 'MATCH', 'DONOR', 'BOARD']
@@ -169,31 +137,7 @@ class TestGraphRepository:
 
     async def test_find_matching_edge_no_match(self):
         """Test that None is returned when no edges match."""
-        db_client = MagicMock()
-
-        edge = JourneyEdge(
-            id=uuid4(),
-            from_node_id='BOARD',
-            to_node_id='PREOP',
-            condition_type='range',
-            question_id='brd_risk_score',
-            range_min=Decimal('0.0'),
-            range_max=Decimal('6.999')
-        )
-
-        db_client.fetch = AsyncMock(return_value=[
-            {
-                'id': edge.id,
-                'from_node_id': 'BOARD',
-                'to_node_id': 'PREOP',
-                'condition_type': 'range',
-                'question_id': 'brd_risk_score',
-                'range_min': Decimal('0.0'),
-                'range_max': Decimal('6.999')
-            }
-        ])
-
-        repo = GraphRepository(db_client)
+        repo = GraphRepository(FakeDBClient([_EDGE_TO_PREOP_ROW]))
 
         answers = {'brd_risk_score': 7.5}
         visit_history = ['REFERRAL', 'WORKUP', 'MATCH', 'DONOR', 'BOARD']
@@ -206,8 +150,6 @@ class TestGraphRepository:
 @pytest.mark.asyncio
 class TestRoutingEngineWithGraph:
     async def test_evaluate_transition_with_graph_success(self):
-        graph_repo = MagicMock()
-
         matched_edge = JourneyEdge(
             id=uuid4(),
             from_node_id='BOARD',
@@ -218,9 +160,10 @@ class TestRoutingEngineWithGraph:
             range_max=Decimal('1.0')
         )
 
-        graph_repo.find_matching_edge = AsyncMock(return_value=matched_edge)
-
-        engine = RoutingEngine(config=MagicMock(), graph_repository=graph_repo)
+        engine = RoutingEngine(
+            config=SimpleNamespace(),
+            graph_repository=FakeGraphRepository(matched_edge)
+        )
 
         answers = {'brd_needs_more_tests': 1, 'brd_risk_score': 5}
         visit_history = ['REFERRAL', 'WORKUP', 'MATCH', 'DONOR', 'BOARD']
@@ -238,10 +181,10 @@ class TestRoutingEngineWithGraph:
         assert 'revisit (loop)' in decision.reason
 
     async def test_evaluate_transition_with_graph_no_match(self):
-        graph_repo = MagicMock()
-        graph_repo.find_matching_edge = AsyncMock(return_value=None)
-
-        engine = RoutingEngine(config=MagicMock(), graph_repository=graph_repo)
+        engine = RoutingEngine(
+            config=SimpleNamespace(),
+            graph_repository=FakeGraphRepository(None)
+        )
 
         answers = {'brd_risk_score': 7.5}
         visit_history = ['REFERRAL', 'WORKUP', 'MATCH', 'DONOR', 'BOARD']
@@ -257,7 +200,7 @@ class TestRoutingEngineWithGraph:
         assert 'No matching edge' in decision.reason
 
     async def test_evaluate_transition_without_graph_repository(self):
-        engine = RoutingEngine(config=MagicMock())
+        engine = RoutingEngine(config=SimpleNamespace())
 
         answers = {'brd_needs_more_tests': 1}
         visit_history = ['REFERRAL', 'WORKUP', 'MATCH', 'DONOR', 'BOARD']
@@ -1,9 +1,5 @@
 from utils.hashing import hash_email, hash_password, verify_password
 import pytest
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 
 class TestHashEmail:
@@ -47,10 +43,23 @@ class TestHashEmail:
         assert isinstance(email_hash, str)
 
 
+@pytest.fixture(scope="module")
+def hashed_passwords():
+    # One bcrypt call per distinct password for the whole module. The format
+    # and verify tests only read the hashes; tests that assert salting
+    # behaviour (same password, different hashes) keep their own inline
+    # hash_password calls.
+    passwords = ["TestPassword123", "P@ssw0rd!#$%", "Pässwörd123", "", "SecurePass123"]
+    return {pw: hash_password(pw) for pw in passwords}
+
+
+# Keep the KDF-bound classes on one xdist worker (pytest -n auto
+# --dist=loadgroup) so the CPU-heavy bcrypt work overlaps the DB-bound
+# modules running elsewhere instead of spreading across every worker.
+@pytest.mark.xdist_group("bcrypt")
 class TestHashPassword:
-    def test_hash_password_returns_bcrypt_hash(self):
-        password = "TestPassword123"
-        password_hash = hash_password(password)
+    def test_hash_password_returns_bcrypt_hash(self, hashed_passwords):
+        password_hash = hashed_passwords["TestPassword123"]
 
         assert password_hash.startswith("$2b$")
         assert len(password_hash) == 60
@@ -62,63 +71,55 @@ class TestHashPassword:
 
         assert hash1 != hash2
 
-    def test_hash_password_handles_special_characters(self):
-        password = "P@ssw0rd!#$%"
-        password_hash = hash_password(password)
+    def test_hash_password_handles_special_characters(self, hashed_passwords):
+        password_hash = hashed_passwords["P@ssw0rd!#$%"]
 
         assert password_hash.startswith("$2b$")
         assert len(password_hash) == 60
 
-    def test_hash_password_handles_unicode(self):
-        password = "Pässwörd123"
-        password_hash = hash_password(password)
+    def test_hash_password_handles_unicode(self, hashed_passwords):
+        password_hash = hashed_passwords["Pässwörd123"]
 
         assert password_hash.startswith("$2b$")
         assert len(password_hash) == 60
 
 
+@pytest.mark.xdist_group("bcrypt")
 class TestVerifyPassword:
-    def test_verify_password_correct_password(self):
+    def test_verify_password_correct_password(self, hashed_passwords):
         password = "TestPassword123"
-        password_hash = hash_password(password)
 
-        assert verify_password(password, password_hash) is True
+        assert verify_password(password, hashed_passwords[password]) is True
 
-    def test_verify_password_incorrect_password(self):
-        password = "TestPassword123"
+    def test_verify_password_incorrect_password(self, hashed_passwords):
         wrong_password = "WrongPassword456"
-        password_hash = hash_password(password)
 
-        assert verify_password(wrong_password, password_hash) is False
+        assert verify_password(wrong_password, hashed_passwords["TestPassword123"]) is False
 
-    def test_verify_password_case_sensitive(self):
-        password = "TestPassword123"
+    def test_verify_password_case_sensitive(self, hashed_passwords):
         wrong_case = "testpassword123"
-        password_hash = hash_password(password)
 
-        assert verify_password(wrong_case, password_hash) is False
+        assert verify_password(wrong_case, hashed_passwords["TestPassword123"]) is False
 
-    def test_verify_password_with_special_characters(self):
+    def test_verify_password_with_special_characters(self, hashed_passwords):
         password = "P@ssw0rd!#$%"
-        password_hash = hash_password(password)
 
-        assert verify_password(password, password_hash) is True
+        assert verify_password(password, hashed_passwords[password]) is True
 
-    def test_verify_password_empty_string(self):
-        password = ""
-        password_hash = hash_password(password)
+    def test_verify_password_empty_string(self, hashed_passwords):
+        password_hash = hashed_passwords[""]
 
-        assert verify_password(password, password_hash) is True
+        assert verify_password("", password_hash) is True
         assert verify_password("not empty", password_hash) is False
 
 
 class TestHashingIntegration:
-    def test_email_and_password_hashing_together(self):
+    def test_email_and_password_hashing_together(self, hashed_passwords):
         email = "user@example.com"
         password = "SecurePass123"
 
         email_hash = hash_email(email)
-        password_hash = hash_password(password)
+        password_hash = hashed_passwords[password]
 
         assert len(email_hash) == 64
         assert password_hash.startswith("$2b$")
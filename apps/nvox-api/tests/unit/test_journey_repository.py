@@ -1,53 +1,52 @@
 import pytest
 from uuid import uuid4
-from repositories.journey_repository import JourneyRepository
-from nvox_common.db.nvox_db_client import NvoxDBClient
 
-
-@pytest.fixture
-def journey_repository(db_pool) -> JourneyRepository:
-    db_client = NvoxDBClient(db_pool)
-    return JourneyRepository(db_client)
+# The journey_repository fixture comes from conftest.py, bound to the
+# per-test transaction connection: every row written here disappears with
+# the rollback, and no commit (or its WAL fsync) ever happens.
+
+# One statement seeds the user, its journey state and the initial path row;
+# each CTE selects from the previous one, so the inserts are ordered and the
+# three setup round-trips per test collapse into a single one.
+_SEED_USER_SQL = """
+    WITH new_user AS (
+        INSERT INTO users (id, email_hash, password_hash)
+        VALUES ($1, $2, $3)
+        RETURNING id
+    ),
+    new_state AS (
+        INSERT INTO user_journey_state (user_id, current_stage_id, visit_number)
+        SELECT id, $4, $5 FROM new_user
+        RETURNING user_id
+    )
+    INSERT INTO user_journey_path (user_id, stage_id, visit_number, is_current)
+    SELECT user_id, $4, $5, TRUE FROM new_state
+"""
 
 
 @pytest.fixture
-async def test_user_id(journey_repository, db_pool):
+async def test_user_id(clean_db):
     user_id = uuid4()
 
-    async with db_pool.acquire() as conn:
-        await conn.execute(
-            """
-            INSERT INTO users (id, email_hash, password_hash)
-            VALUES ($1, $2, $3)
-            """,
-            user_id, "test_email_hash", "test_password_hash"
-        )
-
-    await journey_repository.create_journey_state(
-        user_id=user_id,
-        stage_id="REFERRAL",
-        visit_number=1
-    )
-    await journey_repository.enter_stage(
-        user_id=user_id,
-        stage_id="REFERRAL",
-        visit_number=1
+    await clean_db.execute(
+        _SEED_USER_SQL,
+        user_id, "test_email_hash", "test_password_hash", "REFERRAL", 1
     )
+
     return user_id
 
 
 @pytest.mark.asyncio
-async def test_create_journey_state(journey_repository, db_pool):
+async def test_create_journey_state(journey_repository, clean_db):
     user_id = uuid4()
 
-    async with db_pool.acquire() as conn:
-        await conn.execute(
-            """
-            INSERT INTO users (id, email_hash, password_hash)
-            VALUES ($1, $2, $3)
-            """,
-            user_id, "test_email_hash", "test_password_hash"
-        )
+    await clean_db.execute(
+        """
+        INSERT INTO users (id, email_hash, password_hash)
+        VALUES ($1, $2, $3)
+        """,
+        user_id, "test_email_hash", "test_password_hash"
+    )
 
     await journey_repository.create_journey_state(
         user_id=user_id,
@@ -123,19 +122,16 @@ async def test_save_answer_versioning(test_user_id, journey_repository):
 
 @pytest.mark.asyncio
 async def test_get_current_answers(test_user_id, journey_repository):
-    await journey_repository.save_answer(
-        user_id=test_user_id,
-        stage_id="REFERRAL",
-        question_id="ref_karnofsky",
-        answer_value=80.0,
-        visit_number=1
-    )
-    await journey_repository.save_answer(
-        user_id=test_user_id,
-        stage_id="REFERRAL",
-        question_id="ref_eligible",
-        answer_value=True,
-        visit_number=1
+    # Two distinct questions land in one round-trip via the bulk path. The
+    # versioning test above keeps its sequential save_answer calls: two
+    # versions of the same question in one batch is outside the bulk
+    # method's contract.
+    await journey_repository.save_answers_bulk(
+        test_user_id,
+        [
+            ("REFERRAL", "ref_karnofsky", 80.0, 1),
+            ("REFERRAL", "ref_eligible", True, 1),
+        ]
     )
 
     answers = await journey_repository.get_current_answers(test_user_id)
@@ -201,3 +197,38 @@ async def test_get_path_history(test_user_id, journey_repository):
 
     history = await journey_repository.get_path_history(test_user_id)
     assert len(history) >= 2  # At least WORKUP and EXIT
+
+
+@pytest.mark.asyncio
+async def test_anonymize_users_bulk(journey_repository, clean_db):
+    user_ids = [uuid4() for _ in range(3)]
+    await clean_db.executemany(
+        "INSERT INTO users (id, email_hash, password_hash) VALUES ($1, $2, $3)",
+        [(user_id, f"hash_{i}", "pw_hash") for i, user_id in enumerate(user_ids)]
+    )
+
+    # Distinct replacement hashes so a mixed-up UNNEST zip (hash applied to
+    # the wrong user) fails the assertions below, not just a no-op would.
+    await journey_repository.anonymize_users_bulk([
+        (user_ids[0], "anon_hash_0"),
+        (user_ids[1], "anon_hash_1"),
+    ])
+
+    rows = await clean_db.fetch(
+        "SELECT id, email_hash, password_hash FROM users WHERE id = ANY($1::uuid[])",
+        user_ids
+    )
+    by_id = {row["id"]: row for row in rows}
+    assert by_id[user_ids[0]]["email_hash"] == "anon_hash_0"
+    assert by_id[user_ids[0]]["password_hash"] == "ANONYMIZED"
+    assert by_id[user_ids[1]]["email_hash"] == "anon_hash_1"
+    assert by_id[user_ids[1]]["password_hash"] == "ANONYMIZED"
+
+    # The user outside the batch keeps its original credentials.
+    assert by_id[user_ids[2]]["email_hash"] == "hash_2"
+    assert by_id[user_ids[2]]["password_hash"] == "pw_hash"
+
+
+@pytest.mark.asyncio
+async def test_anonymize_users_bulk_empty_batch(journey_repository):
+    await journey_repository.anonymize_users_bulk([])
@@ -1,13 +1,9 @@
 from utils.hashing import hash_email, hash_password
 from repositories.user_repository import UserRepository
 import pytest
-import sys
-from pathlib import Path
 from uuid import uuid4, UUID
 from datetime import datetime
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 
 @pytest.mark.asyncio
 class TestUserRepositoryCreate:
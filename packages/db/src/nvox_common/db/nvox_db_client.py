@@ -1,5 +1,6 @@
+import asyncio
 import asyncpg
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 from contextlib import asynccontextmanager
 
 
@@ -7,17 +8,51 @@ class NvoxDBClient:
     def __init__(self, pool: asyncpg.Pool):
         self.pool = pool
 
+    # Single-statement calls go straight through the pool's own
+    # fetch/execute wrappers, which acquire and release internally without
+    # the extra context-manager frames. acquire() is kept only where one
+    # pinned connection genuinely matters: cursors, transactions and
+    # fetch_many batches.
     async def fetch(self, query: str, *args: Any) -> list[asyncpg.Record]:
-        async with self.pool.acquire() as conn:
-            return await conn.fetch(query, *args)
+        return await self.pool.fetch(query, *args)
 
     async def fetchRow(self, query: str, *args: Any) -> Optional[asyncpg.Record]:
-        async with self.pool.acquire() as conn:
-            return await conn.fetchrow(query, *args)
+        return await self.pool.fetchrow(query, *args)
+
+    async def fetchVal(self, query: str, *args: Any) -> Any:
+        return await self.pool.fetchval(query, *args)
 
     async def execute(self, query: str, *args: Any) -> str:
+        return await self.pool.execute(query, *args)
+
+    async def executemany(self, query: str, args: list[tuple]) -> None:
+        await self.pool.executemany(query, args)
+
+    async def fetch_many(
+        self, queries: list[tuple[str, tuple]]
+    ) -> list[list[asyncpg.Record]]:
+        """Run several independent reads on one pooled connection.
+
+        A list of (query, args) pairs is executed back to back, paying the
+        pool checkout once for the whole batch instead of once per query.
+        Results come back in query order. Statement parse/plan reuse needs
+        no extra caching here: asyncpg already keeps a per-connection
+        prepared-statement cache.
+        """
         async with self.pool.acquire() as conn:
-            return await conn.execute(query, *args)
+            return [await conn.fetch(query, *args) for query, args in queries]
+
+    async def iterate(
+        self, query: str, *args: Any, prefetch: int = 256
+    ) -> AsyncIterator[asyncpg.Record]:
+        """Stream rows via a server-side cursor instead of materializing the
+        whole result set. The connection is held until iteration finishes,
+        since asyncpg cursors require an open transaction.
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                async for record in conn.cursor(query, *args, prefetch=prefetch):
+                    yield record
 
     @asynccontextmanager
     async def transaction(self):
@@ -27,14 +62,46 @@ class NvoxDBClient:
 
 
 class TransactionClient:
+    """NvoxDBClient lookalike bound to a single connection.
+
+    An asyncpg connection only runs one query at a time, so operations are
+    serialized through a lock: callers that asyncio.gather several reads
+    (valid against the pool-backed client) stay correct here too.
+    """
+
     def __init__(self, conn: asyncpg.Connection):
         self.conn = conn
+        self._lock = asyncio.Lock()
 
     async def fetch(self, query: str, *args: Any) -> list[asyncpg.Record]:
-        return await self.conn.fetch(query, *args)
+        async with self._lock:
+            return await self.conn.fetch(query, *args)
 
     async def fetchRow(self, query: str, *args: Any) -> Optional[asyncpg.Record]:
-        return await self.conn.fetchrow(query, *args)
+        async with self._lock:
+            return await self.conn.fetchrow(query, *args)
+
+    async def fetchVal(self, query: str, *args: Any) -> Any:
+        async with self._lock:
+            return await self.conn.fetchval(query, *args)
 
     async def execute(self, query: str, *args: Any) -> str:
-        return await self.conn.execute(query, *args)
+        async with self._lock:
+            return await self.conn.execute(query, *args)
+
+    async def executemany(self, query: str, args: list[tuple]) -> None:
+        async with self._lock:
+            await self.conn.executemany(query, args)
+
+    async def fetch_many(
+        self, queries: list[tuple[str, tuple]]
+    ) -> list[list[asyncpg.Record]]:
+        async with self._lock:
+            return [await self.conn.fetch(query, *args) for query, args in queries]
+
+    async def iterate(
+        self, query: str, *args: Any, prefetch: int = 256
+    ) -> AsyncIterator[asyncpg.Record]:
+        async with self._lock:
+            async for record in self.conn.cursor(query, *args, prefetch=prefetch):
+                yield record
@@ -10,6 +10,14 @@ REDIS_CONFIG = {
     "max_connections": int(os.getenv("REDIS_MAX_CONNECTIONS", "50")),
     "socket_timeout": int(os.getenv("REDIS_TIMEOUT", "5")),
     "socket_connect_timeout": int(os.getenv("REDIS_TIMEOUT", "5")),
+    # RESP3. redis-py picks its C parser automatically when the hiredis
+    # package is importable (pulled in via the redis[hiredis] extra), which
+    # replaces the pure-Python reply scan on every GET/SET.
+    "protocol": 3,
+    # Ping idle pooled connections instead of discovering dead ones
+    # mid-command, and fail timeouts fast rather than retrying blind.
+    "health_check_interval": 30,
+    "retry_on_timeout": False,
 }
 
 
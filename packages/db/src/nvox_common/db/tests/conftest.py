@@ -1,173 +1,219 @@
+import os
 import pytest
 from typing import AsyncGenerator, Generator
 import asyncpg
+from testcontainers.core.config import testcontainers_config
 from testcontainers.postgres import PostgresContainer
 
+# Container readiness is already a real probe (testcontainers execs psql
+# inside the container until it answers), but it polls on a 1 s interval —
+# worst case a full second of dead air after Postgres is up. Tighten the
+# default; an explicit TC_POOLING_INTERVAL in the environment wins either
+# way.
+if "TC_POOLING_INTERVAL" not in os.environ:
+    testcontainers_config.sleep_time = 0.1
 
-@pytest.fixture(scope="class")
+
+@pytest.fixture(scope="session")
 def postgres_container() -> Generator[PostgresContainer, None, None]:
-    with PostgresContainer(
+    # Session fixtures are per process, so under pytest-xdist (-n auto
+    # --dist=loadfile) each worker gets its own container and database —
+    # no cross-worker state to coordinate. The worker id in the database
+    # name just makes stray containers attributable.
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    container = PostgresContainer(
         image="postgres:15-alpine",
         username="test_user",
         password="test_password",
-        dbname="test_db"
-    ) as postgres:
-        postgres.get_connection_url()
+        dbname=f"test_db_{worker}"
+    )
+    # The container is thrown away after the session, so durability buys
+    # nothing: keep the data directory on tmpfs and turn off fsync, WAL
+    # sync and full-page writes. Insert-heavy tests then never wait on
+    # disk. wal_level=minimal (no replication from a test container)
+    # shrinks WAL volume further.
+    container.with_tmpfs_mount("/var/lib/postgresql/data", size="512m")
+    container.with_command(
+        "postgres"
+        " -c fsync=off"
+        " -c synchronous_commit=off"
+        " -c full_page_writes=off"
+        " -c wal_level=minimal"
+        " -c max_wal_senders=0"
+        # Keep checkpoints out of the session entirely and give the page
+        # cache room; max_wal_size stays at its default so WAL can't
+        # outgrow the 512 MB tmpfs.
+        " -c checkpoint_timeout=60min"
+        " -c shared_buffers=256MB"
+    )
+    with container as postgres:
         yield postgres
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def db_connection_params(postgres_container: PostgresContainer):
-    import urllib.parse
-    conn_url = postgres_container.get_connection_url()
-    parsed = urllib.parse.urlparse(conn_url)
-
+    # The container exposes every connection parameter directly; building a
+    # URL only to shred it with urlparse was a detour (and the sqlalchemy
+    # driver scheme it embeds is irrelevant to asyncpg).
     return {
-        "host": parsed.hostname,
-        "port": parsed.port,
-        "database": parsed.path[1:],
-        "user": parsed.username,
-        "password": parsed.password,
+        "host": postgres_container.get_container_host_ip(),
+        "port": int(postgres_container.get_exposed_port(postgres_container.port)),
+        "database": postgres_container.dbname,
+        "user": postgres_container.username,
+        "password": postgres_container.password,
     }
 
 
-@pytest.fixture(scope="function")
+# The whole schema goes over in one round-trip. The session database is
+# created fresh by the container, so the CREATEs are unconditional — a
+# duplicate means the fixture ran twice and should fail loudly, and plain
+# CREATE skips the IF NOT EXISTS catalog probes. synchronous_commit is
+# off for the setup connection: no point fsyncing WAL for throwaway DDL.
+# The tables are UNLOGGED — crash recovery means nothing to a container
+# that dies with the session, so their writes skip WAL records entirely.
+_SCHEMA_DDL = """
+    SET synchronous_commit = off;
+
+    CREATE UNLOGGED TABLE users (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        email_hash VARCHAR(64) UNIQUE NOT NULL,
+        password_hash VARCHAR(255) NOT NULL,
+        journey_stage VARCHAR(50) NOT NULL DEFAULT 'REFERRAL',
+        journey_started_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+    );
+
+    CREATE INDEX idx_users_email_hash ON users(email_hash);
+    CREATE INDEX idx_users_journey_stage ON users(journey_stage);
+
+    CREATE UNLOGGED TABLE sessions (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        token_jti VARCHAR(255) UNIQUE NOT NULL,
+        expires_at TIMESTAMP NOT NULL,
+        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        revoked_at TIMESTAMP,
+        is_active BOOLEAN NOT NULL DEFAULT TRUE
+    );
+
+    CREATE INDEX idx_sessions_token_jti ON sessions(token_jti);
+    CREATE INDEX idx_sessions_user_id ON sessions(user_id);
+    CREATE INDEX idx_sessions_active ON sessions(is_active) WHERE is_active = TRUE;
+    CREATE INDEX idx_sessions_expires_at ON sessions(expires_at);
+    CREATE INDEX idx_sessions_token_active ON sessions(token_jti) WHERE is_active = TRUE;
+    CREATE INDEX idx_sessions_user_active ON sessions(user_id) WHERE is_active = TRUE;
+
+    CREATE UNLOGGED TABLE user_journey_state (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        current_stage_id VARCHAR(50) NOT NULL,
+        visit_number INT NOT NULL DEFAULT 1,
+        journey_started_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        last_updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        CONSTRAINT uk_user_journey_state_user UNIQUE (user_id),
+        CONSTRAINT chk_visit_number CHECK (visit_number > 0)
+    );
+
+    CREATE INDEX idx_journey_state_user ON user_journey_state(user_id);
+    CREATE INDEX idx_journey_state_stage ON user_journey_state(current_stage_id);
+    CREATE INDEX idx_journey_state_updated ON user_journey_state(last_updated_at DESC);
+
+    CREATE UNLOGGED TABLE user_answers (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        stage_id VARCHAR(50) NOT NULL,
+        question_id VARCHAR(100) NOT NULL,
+        answer_value JSONB NOT NULL,
+        visit_number INT NOT NULL DEFAULT 1,
+        answered_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        version INT NOT NULL DEFAULT 1,
+        is_current BOOLEAN NOT NULL DEFAULT TRUE,
+        CONSTRAINT chk_answer_version CHECK (version > 0),
+        CONSTRAINT chk_answer_visit CHECK (visit_number > 0)
+    );
+
+    CREATE INDEX idx_answers_user_stage ON user_answers(user_id, stage_id);
+    CREATE INDEX idx_answers_user_question ON user_answers(user_id, question_id);
+    CREATE INDEX idx_answers_current ON user_answers(user_id, question_id) WHERE is_current = TRUE;
+    CREATE INDEX idx_answers_answered_at ON user_answers(answered_at DESC);
+    CREATE INDEX idx_answers_stage ON user_answers(stage_id);
+    CREATE INDEX idx_answers_current_stage ON user_answers(user_id, stage_id, visit_number) WHERE is_current = TRUE;
+    -- Mirrors migration 006: guarantees answer version numbers never
+    -- collide per (user_id, question_id), so versioning bugs in the
+    -- save_answer/save_answers_bulk CTEs fail here, not in production.
+    CREATE UNIQUE INDEX uk_answers_user_question_version ON user_answers(user_id, question_id, version);
+
+    CREATE UNLOGGED TABLE stage_transitions (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        from_stage_id VARCHAR(50),
+        to_stage_id VARCHAR(50) NOT NULL,
+        from_visit_number INT,
+        to_visit_number INT NOT NULL,
+        transition_reason TEXT,
+        matched_rule_id VARCHAR(100),
+        matched_question_id VARCHAR(100),
+        matched_answer_value JSONB,
+        transitioned_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        CONSTRAINT chk_transition_visits CHECK (
+            from_visit_number IS NULL OR from_visit_number > 0
+        ),
+        CONSTRAINT chk_to_visit_number CHECK (to_visit_number > 0)
+    );
+
+    CREATE INDEX idx_transitions_user ON stage_transitions(user_id);
+    CREATE INDEX idx_transitions_user_time ON stage_transitions(user_id, transitioned_at DESC);
+    CREATE INDEX idx_transitions_from_stage ON stage_transitions(from_stage_id);
+    CREATE INDEX idx_transitions_to_stage ON stage_transitions(to_stage_id);
+    CREATE INDEX idx_transitions_time ON stage_transitions(transitioned_at DESC);
+
+    CREATE UNLOGGED TABLE user_journey_path (
+        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+        stage_id VARCHAR(50) NOT NULL,
+        visit_number INT NOT NULL DEFAULT 1,
+        entered_at TIMESTAMP NOT NULL DEFAULT NOW(),
+        exited_at TIMESTAMP,
+        is_current BOOLEAN NOT NULL DEFAULT TRUE,
+        CONSTRAINT chk_path_visit_number CHECK (visit_number > 0),
+        CONSTRAINT chk_path_exit_after_entry CHECK (
+            exited_at IS NULL OR exited_at >= entered_at
+        )
+    );
+
+    CREATE INDEX idx_journey_path_user ON user_journey_path(user_id);
+    CREATE INDEX idx_journey_path_user_entered ON user_journey_path(user_id, entered_at DESC);
+    CREATE INDEX idx_journey_path_current ON user_journey_path(user_id) WHERE is_current = TRUE;
+    CREATE INDEX idx_journey_path_stage ON user_journey_path(stage_id);
+    CREATE INDEX idx_journey_path_user_stage ON user_journey_path(user_id, stage_id);
+    CREATE UNIQUE INDEX uk_user_journey_path_current
+        ON user_journey_path(user_id)
+        WHERE is_current = TRUE;
+"""
+
+
+@pytest.fixture(scope="session")
 async def db_schema(db_connection_params):
     conn = await asyncpg.connect(**db_connection_params)
-
-    await conn.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-            email_hash VARCHAR(64) UNIQUE NOT NULL,
-            password_hash VARCHAR(255) NOT NULL,
-            journey_stage VARCHAR(50) NOT NULL DEFAULT 'REFERRAL',
-            journey_started_at TIMESTAMP NOT NULL DEFAULT NOW(),
-            created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-            updated_at TIMESTAMP NOT NULL DEFAULT NOW()
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_users_email_hash ON users(email_hash);
-        CREATE INDEX IF NOT EXISTS idx_users_journey_stage ON users(journey_stage);
-    """)
-
-    await conn.execute("""
-        CREATE TABLE IF NOT EXISTS sessions (
-            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-            user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-            token_jti VARCHAR(255) UNIQUE NOT NULL,
-            expires_at TIMESTAMP NOT NULL,
-            created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-            revoked_at TIMESTAMP,
-            is_active BOOLEAN NOT NULL DEFAULT TRUE
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_sessions_token_jti ON sessions(token_jti);
-        CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id);
-        CREATE INDEX IF NOT EXISTS idx_sessions_active ON sessions(is_active) WHERE is_active = TRUE;
-        CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions(expires_at);
-    """)
-
-    await conn.execute("""
-        CREATE TABLE IF NOT EXISTS user_journey_state (
-            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-            user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-            current_stage_id VARCHAR(50) NOT NULL,
-            visit_number INT NOT NULL DEFAULT 1,
-            journey_started_at TIMESTAMP NOT NULL DEFAULT NOW(),
-            last_updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
-            created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-            CONSTRAINT uk_user_journey_state_user UNIQUE (user_id),
-            CONSTRAINT chk_visit_number CHECK (visit_number > 0)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_journey_state_user ON user_journey_state(user_id);
-        CREATE INDEX IF NOT EXISTS idx_journey_state_stage ON user_journey_state(current_stage_id);
-        CREATE INDEX IF NOT EXISTS idx_journey_state_updated ON user_journey_state(last_updated_at DESC);
-    """)
-
-    await conn.execute("""
-        CREATE TABLE IF NOT EXISTS user_answers (
-            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-            user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-            stage_id VARCHAR(50) NOT NULL,
-            question_id VARCHAR(100) NOT NULL,
-            answer_value JSONB NOT NULL,
-            visit_number INT NOT NULL DEFAULT 1,
-            answered_at TIMESTAMP NOT NULL DEFAULT NOW(),
-            version INT NOT NULL DEFAULT 1,
-            is_current BOOLEAN NOT NULL DEFAULT TRUE,
-            CONSTRAINT chk_answer_version CHECK (version > 0),
-            CONSTRAINT chk_answer_visit CHECK (visit_number > 0)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_answers_user_stage ON user_answers(user_id, stage_id);
-        CREATE INDEX IF NOT EXISTS idx_answers_user_question ON user_answers(user_id, question_id);
-        CREATE INDEX IF NOT EXISTS idx_answers_current ON user_answers(user_id, question_id) WHERE is_current = TRUE;
-        CREATE INDEX IF NOT EXISTS idx_answers_answered_at ON user_answers(answered_at DESC);
-        CREATE INDEX IF NOT EXISTS idx_answers_stage ON user_answers(stage_id);
-    """)
-
-    await conn.execute("""
-        CREATE TABLE IF NOT EXISTS stage_transitions (
-            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-            user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-            from_stage_id VARCHAR(50),
-            to_stage_id VARCHAR(50) NOT NULL,
-            from_visit_number INT,
-            to_visit_number INT NOT NULL,
-            transition_reason TEXT,
-            matched_rule_id VARCHAR(100),
-            matched_question_id VARCHAR(100),
-            matched_answer_value JSONB,
-            transitioned_at TIMESTAMP NOT NULL DEFAULT NOW(),
-            CONSTRAINT chk_transition_visits CHECK (
-                from_visit_number IS NULL OR from_visit_number > 0
-            ),
-            CONSTRAINT chk_to_visit_number CHECK (to_visit_number > 0)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_transitions_user ON stage_transitions(user_id);
-        CREATE INDEX IF NOT EXISTS idx_transitions_user_time ON stage_transitions(user_id, transitioned_at DESC);
-        CREATE INDEX IF NOT EXISTS idx_transitions_from_stage ON stage_transitions(from_stage_id);
-        CREATE INDEX IF NOT EXISTS idx_transitions_to_stage ON stage_transitions(to_stage_id);
-        CREATE INDEX IF NOT EXISTS idx_transitions_time ON stage_transitions(transitioned_at DESC);
-    """)
-
-    await conn.execute("""
-        CREATE TABLE IF NOT EXISTS user_journey_path (
-            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-            user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-            stage_id VARCHAR(50) NOT NULL,
-            visit_number INT NOT NULL DEFAULT 1,
-            entered_at TIMESTAMP NOT NULL DEFAULT NOW(),
-            exited_at TIMESTAMP,
-            is_current BOOLEAN NOT NULL DEFAULT TRUE,
-            CONSTRAINT chk_path_visit_number CHECK (visit_number > 0),
-            CONSTRAINT chk_path_exit_after_entry CHECK (
-                exited_at IS NULL OR exited_at >= entered_at
-            )
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_journey_path_user ON user_journey_path(user_id);
-        CREATE INDEX IF NOT EXISTS idx_journey_path_user_entered ON user_journey_path(user_id, entered_at DESC);
-        CREATE INDEX IF NOT EXISTS idx_journey_path_current ON user_journey_path(user_id) WHERE is_current = TRUE;
-        CREATE INDEX IF NOT EXISTS idx_journey_path_stage ON user_journey_path(stage_id);
-        CREATE UNIQUE INDEX IF NOT EXISTS uk_user_journey_path_current
-            ON user_journey_path(user_id)
-            WHERE is_current = TRUE;
-    """)
-
-    await conn.close()
+    try:
+        await conn.execute(_SCHEMA_DDL)
+    finally:
+        await conn.close()
     yield
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 async def db_pool(db_connection_params, db_schema) -> AsyncGenerator[asyncpg.Pool, None]:
     _ = db_schema
 
+    # min == max, matching the production pool config: all three
+    # connections are built here in fixture setup, so no test pays a
+    # connection handshake mid-run when it bursts past the first one.
     pool = await asyncpg.create_pool(
         **db_connection_params,
-        min_size=1,
+        min_size=3,
         max_size=3,
     )
     yield pool
@@ -175,10 +221,19 @@ async def db_pool(db_connection_params, db_schema) -> AsyncGenerator[asyncpg.Poo
 
 
 @pytest.fixture(scope="function", autouse=False)
-async def clean_db(db_pool: asyncpg.Pool):
-    async with db_pool.acquire() as conn:
-        try:
-            await conn.execute("TRUNCATE users, user_journey_state, user_answers, stage_transitions, user_journey_path CASCADE")
-        except Exception:
-            pass
-    yield
+async def clean_db(db_pool: asyncpg.Pool) -> AsyncGenerator[asyncpg.Connection, None]:
+    """Isolate the test in a transaction that is rolled back on teardown.
+
+    All test writes happen on this one connection and vanish with the
+    rollback, replacing the per-test TRUNCATE sweep. The connection is
+    yielded so tests can assert on not-yet-committed state; anything that
+    should observe the test's writes has to go through it.
+    """
+    conn = await db_pool.acquire()
+    tx = conn.transaction()
+    await tx.start()
+    try:
+        yield conn
+    finally:
+        await tx.rollback()
+        await db_pool.release(conn)